@@ -1,13 +1,17 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Any, Dict
+import os
 
 try:
     from roma_engine.sentient_roma_runner import solve as roma_solve
 except Exception:
     roma_solve = None
 
-app = FastAPI(title="Sentient Health Tracker (ROMA)")
+app = FastAPI(title="Sentient Health Tracker (ROMA)", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 class WeeklyData(BaseModel):
     data: Dict[str, Any]
@@ -31,3 +35,8 @@ async def normalize(payload: WeeklyData):
     if roma_solve is None:
         raise HTTPException(status_code=500, detail="ROMA runtime not available")
     return await roma_solve("health_weekly_report", {"data": payload.data})
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("api.sentient_roma_api:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools",
+                workers=int(os.getenv("WEB_CONCURRENCY", "4")))
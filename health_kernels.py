@@ -0,0 +1,131 @@
+"""
+Health report kernels
+
+The branchy, string-building half of the local analysis: turning metric bands
+into insights/recommendations and rendering the fallback weekly report.
+Fully annotated and free of numpy/numba so it can be compiled with mypyc
+(``mypyc health_kernels.py``); without a build the plain module is imported.
+"""
+
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+_RHR_INSIGHTS: Final[Tuple[str, ...]] = (
+    "Very low resting HR; could be athletic or bradycardia—interpret in context.",
+    "Excellent resting HR (well-trained range).",
+    "Good resting HR.",
+    "Slightly elevated resting HR—watch stress, sleep, hydration.",
+    "High resting HR—consider recovery, hydration, or check with a clinician if persistent.",
+)
+_HRV_INSIGHTS: Final[Tuple[str, ...]] = (
+    "HRV looks strong—good recovery signal.",
+    "HRV is moderate—keep sleep and stress in check.",
+    "Low HRV—prioritize sleep, light activity, and hydration.",
+)
+_CALORIES_LOW_INSIGHT: Final = "Weekly calorie burn seems low—more daily movement or longer sessions could help."
+_RUNS_INSIGHTS: Final[Tuple[str, ...]] = (
+    "Great running frequency—maintain 1 easy + 1 quality + 1 long structure.",
+    "Consider aiming for 3 runs/week (easy, quality, long).",
+)
+# Flag names and their recommendation, in output order
+_LOCAL_FLAGS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("resting_hr_high", "Add low-intensity walks and hydration; check caffeine late-day."),
+    ("hrv_low", "Prioritize 7–8h sleep, add a 10–15 min evening wind-down."),
+    ("calories_low", "Sneak in 2k extra steps/day with short walks."),
+    ("runs_low", "Block 3 runs in your calendar to build consistency."),
+)
+# Recommendations are listed in this flag order (hrv, rHR, calories, runs)
+_REC_ORDER: Final[Tuple[int, ...]] = (1, 0, 2, 3)
+_GENERIC_RECS: Final[Tuple[str, ...]] = (
+    "Keep up hydration and consistent bed/wake times.",
+    "Add 5–10 minutes of mobility after workouts.",
+    "Take a short walk after meals when possible.",
+)
+
+def local_result(rhr_band: int, hrv_band: int, runs_band: int, flags: Sequence[bool],
+                 score: int, summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one analysis result; a band of -1 means the metric was absent."""
+    insights: List[str] = []
+    if rhr_band >= 0:
+        insights.append(_RHR_INSIGHTS[rhr_band])
+    if hrv_band >= 0:
+        insights.append(_HRV_INSIGHTS[hrv_band])
+    if flags[2]:
+        insights.append(_CALORIES_LOW_INSIGHT)
+    if runs_band >= 0:
+        insights.append(_RUNS_INSIGHTS[runs_band])
+
+    # Recommendations: flag-specific first, then fill to 3 unique lines
+    recs: List[str] = [_LOCAL_FLAGS[j][1] for j in _REC_ORDER if flags[j]]
+    for g in _GENERIC_RECS:
+        if len(recs) >= 3:
+            break
+        if g not in recs:
+            recs.append(g)
+
+    return {
+        "insights": insights,
+        "flags": [_LOCAL_FLAGS[j][0] for j in range(len(_LOCAL_FLAGS)) if flags[j]],
+        "summary": summary,
+        "score": score,
+        "recommendations": recs[:3],
+    }
+
+def local_summary(rhr: Any, hrv: Any, cals: Any, runs: Optional[int]) -> Dict[str, Any]:
+    """Echo present metrics back; values stay as given (int stays int) for stable output."""
+    summary: Dict[str, Any] = {}
+    if rhr is not None:
+        summary["resting_hr"] = rhr
+    if hrv is not None:
+        summary["hrv"] = hrv
+    if cals is not None:
+        summary["calories_week"] = cals
+    if runs is not None:
+        summary["runs"] = runs
+    return summary
+
+_INV7: Final = 1.0 / 7.0
+_OK: Final = "✅ On track"
+_WARN_STEPS: Final = "⚠️ Aim for 10k/day"
+_WARN_SLEEP: Final = "⚠️ Target 7–8h/night"
+_OK_EX: Final = "✅ ≥3 sessions"
+_WARN_EX: Final = "⚠️ Try to reach 3+/week"
+_WEEKLY_TMPL: Final = (
+    "Weekly Health Report\n"
+    "--------------------\n"
+    "• Daily Steps Avg: {avg_steps:.0f}\n"
+    "• Daily Sleep Avg: {avg_sleep:.1f}h\n"
+    "• Workouts: {workouts}\n"
+    "• Water: {water} L/week\n\n"
+    "Assessment:\n"
+    "- Steps: {assess_steps}\n"
+    "- Sleep: {assess_sleep}\n"
+    "- Exercise: {assess_ex}\n\n"
+    "Recommendations:\n"
+    "1) {rec1}\n"
+    "2) {rec2}\n"
+    "3) {rec3}\n"
+)
+
+def fallback_weekly(data: Dict[str, Any]) -> str:
+    steps = float(data.get("steps", 0))
+    sleep = float(data.get("sleep_hours", 0))
+    workouts = int(data.get("workouts", 0))
+    water = float(data.get("water_liters", 0))
+    avg_steps = steps * _INV7
+    avg_sleep = sleep * _INV7
+    steps_ok = avg_steps >= 10000
+    sleep_ok = avg_sleep >= 7
+    ex_ok = workouts >= 3
+
+    return _WEEKLY_TMPL.format(
+        avg_steps=avg_steps,
+        avg_sleep=avg_sleep,
+        workouts=workouts,
+        water=water,
+        assess_steps=_OK if steps_ok else _WARN_STEPS,
+        assess_sleep=_OK if sleep_ok else _WARN_SLEEP,
+        assess_ex=_OK_EX if ex_ok else _WARN_EX,
+        rec1="Maintain your walking habit" if steps_ok else "Add a 15–20 min brisk walk after lunch",
+        rec2="Keep consistent bedtime" if sleep_ok else "Move bedtime earlier by ~30 minutes",
+        rec3="Nice training cadence" if ex_ok else "Schedule workouts on calendar to lock them in",
+    )
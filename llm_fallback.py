@@ -5,14 +5,67 @@ Handles automatic failover between different LLM providers when quota/credits ar
 """
 
 import os
+import atexit
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional
+import httpx
+import litellm
 from litellm import completion
 import time
 
 # Configure logging to avoid the "Level 'PLAN' already exists" error
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive pool for every litellm call, so provider TLS handshakes are
+# paid once per connection instead of once per completion. HTTP/2 lets the
+# concurrent subtask calls multiplex over one connection per provider.
+_HTTP_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=90),
+    timeout=httpx.Timeout(60.0, connect=10.0),
+)
+litellm.client_session = _HTTP_CLIENT
+atexit.register(_HTTP_CLIENT.close)
+
+# Provider rate-limit guard: cap call starts per minute and calls in flight, so
+# bursts queue here instead of drawing 429s that then cascade through failover
+_MAX_CALLS_PER_MINUTE = int(os.getenv("OR_RPM", "500"))
+_MAX_CONCURRENT_CALLS = int(os.getenv("OR_CONC", "32"))
+
+class _RateLimiter:
+    """Sliding one-minute window of call start times; acquire() blocks while it is full"""
+    
+    def __init__(self, max_per_minute: int):
+        self.max_per_minute = max_per_minute
+        self._starts: deque = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= 60:
+                    self._starts.popleft()
+                if len(self._starts) < self.max_per_minute:
+                    self._starts.append(now)
+                    return
+                delay = 60 - (now - self._starts[0])
+            time.sleep(delay)
+
+_RATE_LIMITER = _RateLimiter(_MAX_CALLS_PER_MINUTE)
+_CALL_SLOTS = threading.BoundedSemaphore(_MAX_CONCURRENT_CALLS)
+
+def _delta_content(chunk) -> Optional[str]:
+    delta = chunk["choices"][0]["delta"]
+    return delta.get("content") if isinstance(delta, dict) else getattr(delta, "content", None)
+
+def _join_stream(chunks) -> Dict[str, Any]:
+    """Collect streamed delta chunks into a non-streaming response shape"""
+    parts = [content for content in map(_delta_content, chunks) if content]
+    return {"choices": [{"message": {"content": "".join(parts)}}]}
+
 class LLMFallback:
     """
     Handles automatic fallback between multiple LLM providers
@@ -20,6 +73,7 @@ class LLMFallback:
     
     def __init__(self):
         self.providers = self._initialize_providers()
+        self._fast_providers = sorted(self.providers, key=lambda p: p["cost_per_1k"])
         self.current_provider_index = 0
         self.last_successful_provider = None
         
@@ -81,24 +135,26 @@ class LLMFallback:
                 "cost_per_1k": 0.0
             })
         
-        logger.info(f"Initialized {len(providers)} LLM providers")
+        logger.info("Initialized %d LLM providers", len(providers))
         return providers
     
-    def call_with_fallback(self, messages: List[Dict], **kwargs) -> Optional[Dict[str, Any]]:
+    def call_with_fallback(self, messages: List[Dict], fast: bool = False, **kwargs) -> Optional[Dict[str, Any]]:
         """
         Call LLM with automatic provider fallback
         
-        Tries providers in order until one succeeds
+        Tries providers in order until one succeeds; with fast=True the cheapest
+        (smallest) models are tried first
         """
         if not self.providers:
             raise Exception("No LLM providers configured")
         
         last_error = None
+        providers = self._fast_providers if fast else self.providers
         
         # Try each provider
-        for i, provider in enumerate(self.providers):
+        for i, provider in enumerate(providers):
             try:
-                logger.info(f"Trying provider {provider['name']} (model: {provider['model']})")
+                logger.debug("Trying provider %s (model: %s)", provider["name"], provider["model"])
                 
                 # Prepare call parameters
                 call_params = {
@@ -112,26 +168,31 @@ class LLMFallback:
                     call_params["base_url"] = provider["base_url"]
                 
                 # Make the call
-                start_time = time.time()
-                response = completion(**call_params)
-                call_time = time.time() - start_time
+                _RATE_LIMITER.acquire()
+                with _CALL_SLOTS:
+                    start_time = time.time()
+                    response = completion(**call_params)
+                    if call_params.get("stream"):
+                        # Drain inside the try so a stream that dies mid-way still fails over
+                        response = _join_stream(response)
+                    call_time = time.time() - start_time
                 
                 # Success! 
                 self.last_successful_provider = provider["name"]
-                logger.info(f"✅ Success with {provider['name']} in {call_time:.2f}s")
+                logger.info("✅ Success with %s in %.2fs", provider["name"], call_time)
                 
                 return response
                 
             except Exception as e:
                 error_msg = str(e)
-                logger.warning(f"❌ Provider {provider['name']} failed: {error_msg}")
+                logger.warning("❌ Provider %s failed: %s", provider["name"], error_msg)
                 last_error = e
                 
                 # Check for specific quota/credit errors
                 if any(keyword in error_msg.lower() for keyword in [
                     "quota", "rate limit", "insufficient", "credits", "billing", "exceeded"
                 ]):
-                    logger.info(f"🔄 {provider['name']} quota exhausted, trying next provider...")
+                    logger.info("🔄 %s quota exhausted, trying next provider...", provider["name"])
                     continue
                     
                 # For other errors, try next provider after short delay
@@ -157,9 +218,60 @@ class LLMFallback:
             response = self.call_with_fallback(messages, **kwargs)
             return response["choices"][0]["message"]["content"]
         except Exception as e:
-            logger.error(f"Simple completion failed: {e}")
+            logger.error("Simple completion failed: %s", e)
             return f"Error: LLM completion failed - {str(e)}"
     
+    def stream_completion(self, prompt: str, system_prompt: str = "", **kwargs) -> Iterator[str]:
+        """
+        Yield completion text as it streams in
+        
+        Providers are only switched before the first token; once text has been
+        yielded a mid-stream failure ends the stream instead of restarting it
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        last_error = None
+        for provider in self.providers:
+            call_params = {
+                "model": provider["model"],
+                "messages": messages,
+                "api_key": provider["api_key"],
+                **kwargs,
+                "stream": True
+            }
+            if provider["base_url"]:
+                call_params["base_url"] = provider["base_url"]
+            
+            # Rate-limited but not slot-bound: the caller decides how long a stream stays open
+            _RATE_LIMITER.acquire()
+            try:
+                chunks = iter(completion(**call_params))
+                first = next(chunks, None)
+            except Exception as e:
+                logger.warning("❌ Provider %s failed to stream: %s", provider["name"], e)
+                last_error = e
+                continue
+            
+            self.last_successful_provider = provider["name"]
+            if first is not None:
+                content = _delta_content(first)
+                if content:
+                    yield content
+            try:
+                for chunk in chunks:
+                    content = _delta_content(chunk)
+                    if content:
+                        yield content
+            except Exception as e:
+                logger.error("Stream from %s broke off: %s", provider["name"], e)
+            return
+        
+        logger.error("❌ All LLM providers failed!")
+        yield f"Error: LLM completion failed - {last_error or 'No LLM providers configured'}"
+    
     def get_status(self) -> Dict[str, Any]:
         """Get fallback system status"""
         return {
@@ -177,6 +289,10 @@ def call_llm_with_fallback(prompt: str, system_prompt: str = "", **kwargs) -> st
     """Global function for easy LLM calling with fallback"""
     return fallback_llm.simple_completion(prompt, system_prompt, **kwargs)
 
+def stream_llm_with_fallback(prompt: str, system_prompt: str = "", **kwargs) -> Iterator[str]:
+    """Global function for streaming LLM text with fallback"""
+    return fallback_llm.stream_completion(prompt, system_prompt, **kwargs)
+
 def get_fallback_status() -> Dict[str, Any]:
     """Get fallback system status"""
     return fallback_llm.get_status()
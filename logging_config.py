@@ -5,13 +5,18 @@ This sets up proper logging configuration and prevents duplicate level registrat
 """
 
 import logging
+import os
 import sys
 from typing import Optional
 
-def setup_logging(level: str = "INFO") -> None:
+def setup_logging(level: Optional[str] = None) -> None:
     """
     Set up logging configuration to prevent the "Level 'PLAN' already exists" error
+    
+    The level defaults to LOG_LEVEL from the environment (INFO if unset); production
+    can set WARNING to skip the per-request info lines entirely
     """
+    level = level or os.getenv("LOG_LEVEL", "INFO")
     
     # Clear any existing handlers to prevent conflicts
     root_logger = logging.getLogger()
@@ -37,6 +42,10 @@ def setup_logging(level: str = "INFO") -> None:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
     
+    # ROMA engine/agent tracing (roma.runner, roma.health) is debug-level; it's only
+    # formatted when ROMA_LOG_LEVEL=DEBUG, so the hot path pays just a level check
+    logging.getLogger("roma").setLevel(getattr(logging, os.getenv("ROMA_LOG_LEVEL", "INFO").upper(), logging.INFO))
+    
     # Prevent the "PLAN" level error by checking if custom levels exist
     if not hasattr(logging, 'PLAN'):
         try:
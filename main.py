@@ -1,22 +1,84 @@
-from fastapi import FastAPI, HTTPException, Header, Depends, Query
+from fastapi import FastAPI, HTTPException, Header, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import httpx, os, logging, json
+from typing import Dict, Any, Optional, List, Set, Callable, Awaitable
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from cachetools import TTLCache
+import httpx, os, logging, json, asyncio, hashlib, orjson, time
+import numpy as np
+
+# Compiled with mypyc when a build is present, plain Python otherwise
+from health_kernels import fallback_weekly, local_result, local_summary
 
 # ----------------- App setup -----------------
 log = logging.getLogger("health")
-app = FastAPI(title="Health Tracker")
+
+ROMA_BASE = os.getenv("ROMA_URL", "http://localhost:3001") + "/api/simple"
+
+ROMA_STATUS_INTERVAL = float(os.getenv("ROMA_STATUS_INTERVAL", "5"))
+
+async def _refresh_roma_status(app: FastAPI) -> None:
+    """Keep app.state.roma_ok fresh so /health never waits on the upstream."""
+    while True:
+        try:
+            r = await app.state.roma.get("/status", timeout=10)
+            app.state.roma_ok = r.status_code == 200
+        except Exception:
+            app.state.roma_ok = False
+        await asyncio.sleep(ROMA_STATUS_INTERVAL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Under gunicorn --preload the engine's pool was filled in the master by
+    # create_all; each worker starts its own connections instead of sharing those
+    engine.dispose(close=False)
+    # One pooled client for all ROMA calls (keep-alive instead of a handshake per request)
+    app.state.roma = httpx.AsyncClient(
+        base_url=ROMA_BASE,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=30,
+    )
+    app.state.roma_ok = False
+    app.state.report_queue = asyncio.Queue()
+    background = [
+        asyncio.create_task(_refresh_roma_status(app)),
+        asyncio.create_task(_report_writer(app.state.report_queue)),
+    ]
+    try:
+        yield
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        await app.state.roma.aclose()
+
+app = FastAPI(title="Health Tracker", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(GZipMiddleware, minimum_size=1024)  # report payloads are text-heavy JSON
+
+@app.middleware("http")
+async def roma_cache_header(request, call_next):
+    # The endpoint task inherits this context, so it fills the same set we read back here
+    outcomes: Set[str] = set()
+    token = _cache_outcomes.set(outcomes)
+    try:
+        response = await call_next(request)
+    finally:
+        _cache_outcomes.reset(token)
+    if outcomes:
+        response.headers["X-Cache"] = "MISS" if "MISS" in outcomes else "HIT"
+    return response
 
 # Serve a lightweight UI if you have static/index.html
 if os.path.isdir("static"):
     app.mount("/", StaticFiles(directory="static", html=True), name="static")
 
-ROMA_BASE = os.getenv("ROMA_URL", "http://localhost:3001") + "/api/simple"
-
 # Optional API key (protect /health and /reports, and you can enable for others)
 API_KEY = os.getenv("API_KEY", "demo-key-12345")  # default demo key for Replit
 
@@ -52,28 +114,120 @@ def get_db():
     finally:
         db.close()
 
+# Reports saved by the analysis endpoints go through one writer task: whatever
+# queued up while the previous commit was running is written in a single batch,
+# and the blocking SQLAlchemy work stays off the event loop.
+REPORT_BATCH_SIZE = 32
+
+def _write_reports(recs: List[ReportDB]) -> List[int]:
+    db: Session = SessionLocal()
+    try:
+        db.add_all(recs)
+        db.flush()
+        ids = [rec.id for rec in recs]
+        db.commit()
+        return ids
+    finally:
+        db.close()
+
+async def _report_writer(queue: asyncio.Queue) -> None:
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < REPORT_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            ids = await run_in_threadpool(_write_reports, [rec for rec, _ in batch])
+        except Exception as e:
+            log.warning("report batch write failed: %s", e)
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+        else:
+            for (_, fut), report_id in zip(batch, ids):
+                if not fut.done():
+                    fut.set_result(report_id)
+
+async def _save_report(kind: str, input_json: str, output_text: str, metrics_json: Optional[str] = None) -> int:
+    fut = asyncio.get_running_loop().create_future()
+    rec = ReportDB(kind=kind, input_json=input_json, output_text=output_text, metrics_json=metrics_json)
+    await app.state.report_queue.put((rec, fut))
+    return await fut
+
 # ----------------- Schemas -----------------
-class HealthData(BaseModel):
-    data: Dict[str, Any]
+# /analyze and /weekly-report take {"data": {...}}; the payload is freeform, so it
+# is parsed straight from the body instead of through a pydantic model.
+async def _read_health_data(request: Request) -> Dict[str, Any]:
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(400, "Request body must be valid JSON")
+    d = body.get("data", {}) if isinstance(body, dict) else None
+    if not isinstance(d, dict):
+        raise HTTPException(400, "Expected a JSON object with a 'data' object")
+    return d
 
 class ChatMessage(BaseModel):
     message: str
     save: Optional[bool] = False  # save chat as a report?
 
 # ----------------- ROMA helpers -----------------
+_BAD_EXACT = frozenset({"", "placeholder", "ok"})
+
 def _bad(text: Optional[str]) -> bool:
     if not isinstance(text, str):
         return True
     t = text.strip().lower()
-    return (t == "" or t.startswith("echo:") or t == "placeholder" or t == "ok")
+    return t in _BAD_EXACT or t.startswith("echo:")
+
+# Cache-aside for ROMA replies: identical payloads within the TTL skip the upstream call.
+_roma_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+# Upstream calls in flight, by cache key; removed as soon as the call settles
+_roma_inflight: Dict[bytes, "asyncio.Future[Optional[str]]"] = {}
+# Per-request collector of HIT/MISS outcomes, read back by the X-Cache middleware
+_cache_outcomes: ContextVar[Optional[Set[str]]] = ContextVar("roma_cache_outcomes", default=None)
+
+def _cache_key(route: str, payload: Dict[str, Any]) -> bytes:
+    canonical = orjson.dumps([route, payload], default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+def _note_cache(outcome: str) -> None:
+    outcomes = _cache_outcomes.get()
+    if outcomes is not None:
+        outcomes.add(outcome)
+
+async def _cached(route: str, payload: Dict[str, Any], fetch: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+    key = _cache_key(route, payload)
+    if key in _roma_cache:
+        _note_cache("HIT")
+        return _roma_cache[key]
+    # Concurrent identical requests share the first one's upstream call
+    pending = _roma_inflight.get(key)
+    if pending is not None:
+        _note_cache("HIT")
+        # shield: a cancelled waiter must not cancel the call the others are waiting on
+        return await asyncio.shield(pending)
+    _note_cache("MISS")
+    pending = asyncio.get_running_loop().create_future()
+    _roma_inflight[key] = pending
+    out: Optional[str] = None
+    try:
+        out = await fetch()
+        if out is not None:
+            _roma_cache[key] = out
+        return out
+    finally:
+        # Waiters get None if the leader failed or was cancelled, like an upstream miss
+        del _roma_inflight[key]
+        pending.set_result(out)
 
 async def _roma_analysis(data: Dict[str, Any], desc: str, goal: Optional[str] = None) -> Optional[str]:
     payload: Dict[str, Any] = {"data": data, "data_description": desc}
     if goal:
         payload["goal"] = goal
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.post(f"{ROMA_BASE}/analysis", json=payload)
+
+    async def fetch() -> Optional[str]:
+        try:
+            r = await app.state.roma.post("/analysis", json=payload)
             if r.status_code == 200:
                 js = r.json()
                 if isinstance(js, dict):
@@ -82,165 +236,132 @@ async def _roma_analysis(data: Dict[str, Any], desc: str, goal: Optional[str] =
                         return out
                     if out and not isinstance(out, str):
                         return str(out)
-    except Exception as e:
-        log.debug(f"/analysis failed: {e}")
-    return None
+        except Exception as e:
+            log.debug("/analysis failed: %s", e)
+        return None
+
+    return await _cached("/analysis", payload, fetch)
 
 async def _roma_execute(goal: str) -> Optional[str]:
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.post(f"{ROMA_BASE}/execute", json={"goal": goal})
+    payload = {"goal": goal}
+
+    async def fetch() -> Optional[str]:
+        try:
+            r = await app.state.roma.post("/execute", json=payload)
             if r.status_code == 200:
                 js = r.json()
                 out = js.get("final_output")
                 if isinstance(out, str) and not _bad(out):
                     return out
-    except Exception as e:
-        log.debug(f"/execute failed: {e}")
-    return None
+        except Exception as e:
+            log.debug("/execute failed: %s", e)
+        return None
+
+    return await _cached("/execute", payload, fetch)
 
 # ----------------- Local analysis helpers -----------------
+LOCAL_METRICS = ("resting_hr", "hrv", "calories", "runs")
+
+def _score_numpy(rhr: np.ndarray, hrv: np.ndarray, runs: np.ndarray, flag_count: np.ndarray) -> np.ndarray:
+    positives = ((rhr >= 50) & (rhr <= 60)).astype(np.int64) + (hrv >= 70) + (runs >= 3)
+    return np.clip(70 + 5 * positives - 10 * flag_count, 0, 100)
+
+# Numba is optional: with it, cohort scoring runs as one compiled loop
+try:
+    from numba import njit
+
+    @njit("int64[:](float64[:], float64[:], int64[:], int64[:])", cache=True)
+    def _score_kernel(rhr, hrv, runs, flag_count):
+        # runs uses -1 for "missing"; NaN compares False, matching the NumPy path
+        n = rhr.shape[0]
+        out = np.empty(n, np.int64)
+        for i in range(n):
+            positives = 0
+            if rhr[i] >= 50 and rhr[i] <= 60:
+                positives += 1
+            if hrv[i] >= 70:
+                positives += 1
+            if runs[i] >= 3:
+                positives += 1
+            score = 70 + 5 * positives - 10 * flag_count[i]
+            out[i] = 0 if score < 0 else (100 if score > 100 else score)
+        return out
+
+    # Warm up so the first request doesn't pay for compilation
+    _score_kernel(np.zeros(1), np.zeros(1), np.zeros(1, np.int64), np.zeros(1, np.int64))
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _numeric(v: Any) -> float:
+    return float(v) if isinstance(v, (int, float)) else np.nan
+
+def _score_local(cols: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Band every metric and score all rows at once; NaN marks a missing value."""
+    n = max((len(cols[k]) for k in LOCAL_METRICS if k in cols), default=0)
+    missing = np.full(n, np.nan)
+    rhr, hrv, cals, runs = (
+        np.asarray(cols[k], dtype=np.float64) if k in cols else missing for k in LOCAL_METRICS
+    )
+    runs = np.trunc(runs)
+
+    # Band -1 means "metric absent"; bands index into the insight tuples above
+    rhr_band = np.select(
+        [np.isnan(rhr), rhr < 50, (rhr >= 50) & (rhr <= 60), (rhr >= 61) & (rhr <= 70), (rhr >= 71) & (rhr <= 80)],
+        [-1, 0, 1, 2, 3], default=4,
+    )
+    hrv_band = np.select([np.isnan(hrv), hrv >= 70, hrv >= 50], [-1, 0, 1], default=2)
+    runs_band = np.select([np.isnan(runs), runs >= 3], [-1, 0], default=1)
+
+    flags = np.column_stack([rhr_band == 4, hrv_band == 2, cals < 10000, runs_band == 1])
+    flag_count = flags.sum(axis=1).astype(np.int64)
+    if NUMBA_AVAILABLE:
+        runs_i = np.where(np.isnan(runs), -1, runs).astype(np.int64)
+        score = _score_kernel(rhr, hrv, runs_i, flag_count)
+    else:
+        score = _score_numpy(rhr, hrv, runs, flag_count)
+
+    return {
+        "resting_hr": rhr, "hrv": hrv, "calories": cals, "runs": runs,
+        "rhr_band": rhr_band, "hrv_band": hrv_band, "runs_band": runs_band,
+        "flags": flags, "score": score,
+    }
+
+def _row_result(scored: Dict[str, np.ndarray], i: int, summary: Dict[str, Any]) -> dict:
+    return local_result(
+        int(scored["rhr_band"][i]),
+        int(scored["hrv_band"][i]),
+        int(scored["runs_band"][i]),
+        [bool(f) for f in scored["flags"][i]],
+        int(scored["score"][i]),
+        summary,
+    )
+
+def analyze_health_locally_batch(cols: Dict[str, Any]) -> List[dict]:
+    """Score a cohort given column arrays keyed by metric name (NaN = missing)."""
+    scored = _score_local(cols)
+    results = []
+    for i in range(len(scored["score"])):
+        vals = [scored[k][i] for k in LOCAL_METRICS]
+        rhr, hrv, cals, runs = (None if np.isnan(v) else float(v) for v in vals)
+        summary = local_summary(rhr, hrv, cals, None if runs is None else int(runs))
+        results.append(_row_result(scored, i, summary))
+    return results
+
 def analyze_health_locally(d: dict) -> dict:
     """Return structured insights for typical metrics."""
-    out = {"insights": [], "flags": [], "summary": {}}
-
-    # Resting heart rate (rHR)
-    rhr = d.get("resting_hr")
-    if isinstance(rhr, (int, float)):
-        if rhr < 50:
-            out["insights"].append("Very low resting HR; could be athletic or bradycardia—interpret in context.")
-        elif 50 <= rhr <= 60:
-            out["insights"].append("Excellent resting HR (well-trained range).")
-        elif 61 <= rhr <= 70:
-            out["insights"].append("Good resting HR.")
-        elif 71 <= rhr <= 80:
-            out["insights"].append("Slightly elevated resting HR—watch stress, sleep, hydration.")
-        else:
-            out["insights"].append("High resting HR—consider recovery, hydration, or check with a clinician if persistent.")
-            out["flags"].append("resting_hr_high")
-        out["summary"]["resting_hr"] = rhr
-
-    # HRV
-    hrv = d.get("hrv")
-    if isinstance(hrv, (int, float)):
-        if hrv >= 70:
-            out["insights"].append("HRV looks strong—good recovery signal.")
-        elif 50 <= hrv < 70:
-            out["insights"].append("HRV is moderate—keep sleep and stress in check.")
-        else:
-            out["insights"].append("Low HRV—prioritize sleep, light activity, and hydration.")
-            out["flags"].append("hrv_low")
-        out["summary"]["hrv"] = hrv
-
-    # Calories
-    cals = d.get("calories")
-    if isinstance(cals, (int, float)):
-        out["summary"]["calories_week"] = cals
-        if cals < 10000:
-            out["insights"].append("Weekly calorie burn seems low—more daily movement or longer sessions could help.")
-            out["flags"].append("calories_low")
-
-    # Runs
-    runs = d.get("runs")
-    if isinstance(runs, (int, float)):
-        runs = int(runs)
-        out["summary"]["runs"] = runs
-        if runs >= 3:
-            out["insights"].append("Great running frequency—maintain 1 easy + 1 quality + 1 long structure.")
-        else:
-            out["insights"].append("Consider aiming for 3 runs/week (easy, quality, long).")
-            out["flags"].append("runs_low")
-
-    # Score: reward positives, penalize flags
-    positives = 0
-    if isinstance(rhr, (int, float)) and 50 <= rhr <= 60:
-        positives += 1
-    if isinstance(hrv, (int, float)) and hrv >= 70:
-        positives += 1
-    if isinstance(runs, int) and runs >= 3:
-        positives += 1
-    score = 70 + 5 * positives - 10 * len(out["flags"])
-    score = max(0, min(100, score))
-    out["score"] = score
-
-    # Recommendations: fill to 3 unique lines
-    recs = []
-    if "hrv_low" in out["flags"]:
-        recs.append("Prioritize 7–8h sleep, add a 10–15 min evening wind-down.")
-    if "resting_hr_high" in out["flags"]:
-        recs.append("Add low-intensity walks and hydration; check caffeine late-day.")
-    if "calories_low" in out["flags"]:
-        recs.append("Sneak in 2k extra steps/day with short walks.")
-    if "runs_low" in out["flags"]:
-        recs.append("Block 3 runs in your calendar to build consistency.")
-    generic = [
-        "Keep up hydration and consistent bed/wake times.",
-        "Add 5–10 minutes of mobility after workouts.",
-        "Take a short walk after meals when possible.",
-    ]
-    for g in generic:
-        if len(recs) >= 3:
-            break
-        if g not in recs:
-            recs.append(g)
-
-    out["recommendations"] = recs[:3]
-    return out
-
-
-def _fallback_weekly(data: Dict[str, Any]) -> str:
-    steps = float(data.get("steps", 0))
-    sleep = float(data.get("sleep_hours", 0))
-    workouts = int(data.get("workouts", 0))
-    water = float(data.get("water_liters", 0))
-    avg_steps = steps / 7 if steps else 0
-    avg_sleep = sleep / 7 if sleep else 0
-    assess_steps = "✅ On track" if avg_steps >= 10000 else "⚠️ Aim for 10k/day"
-    assess_sleep = "✅ On track" if avg_sleep >= 7 else "⚠️ Target 7–8h/night"
-    assess_ex = "✅ ≥3 sessions" if workouts >= 3 else "⚠️ Try to reach 3+/week"
-
-    rec1 = "Maintain your walking habit" if avg_steps >= 10000 else "Add a 15–20 min brisk walk after lunch"
-    rec2 = "Keep consistent bedtime" if avg_sleep >= 7 else "Move bedtime earlier by ~30 minutes"
-    rec3 = "Nice training cadence" if workouts >= 3 else "Schedule workouts on calendar to lock them in"
-
-    return (
-        "Weekly Health Report\n"
-        "--------------------\n"
-        f"• Daily Steps Avg: {avg_steps:.0f}\n"
-        f"• Daily Sleep Avg: {avg_sleep:.1f}h\n"
-        f"• Workouts: {workouts}\n"
-        f"• Water: {water} L/week\n\n"
-        "Assessment:\n"
-        f"- Steps: {assess_steps}\n"
-        f"- Sleep: {assess_sleep}\n"
-        f"- Exercise: {assess_ex}\n\n"
-        "Recommendations:\n"
-        f"1) {rec1}\n"
-        f"2) {rec2}\n"
-        f"3) {rec3}\n"
-    )
+    scored = _score_local({k: [_numeric(d.get(k))] for k in LOCAL_METRICS})
+    present = {k: d.get(k) if isinstance(d.get(k), (int, float)) else None for k in LOCAL_METRICS}
+    runs = present["runs"]
+    summary = local_summary(present["resting_hr"], present["hrv"], present["calories"],
+                            None if runs is None else int(runs))
+    return _row_result(scored, 0, summary)
 
-# ----------------- Endpoints -----------------
-@app.get("/health", dependencies=[Depends(require_api_key)] if API_KEY else None)
-async def health():
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.get(f"{ROMA_BASE}/status")
-            roma_ok = r.status_code == 200
-    except Exception:
-        roma_ok = False
-    return {"status": "healthy", "roma_available": roma_ok, "timestamp": datetime.utcnow().isoformat()}
 
-@app.post("/weekly-report")
-async def weekly_report(request: HealthData, save: bool = Query(False), db: Session = Depends(get_db)):
-    d = request.data
-    goal = ("Summarize the week, compute daily averages, give a short health assessment, "
-            "and 2–3 specific, actionable recommendations. Keep it concise. Do NOT repeat my prompt.")
-    a1 = await _roma_analysis(d, "weekly health metrics", goal=goal)
-    if a1:
-        text = a1
-    else:
-        goal_exec = f"""
+# ----------------- Endpoints -----------------
+_WEEKLY_GOAL = ("Summarize the week, compute daily averages, give a short health assessment, "
+                "and 2–3 specific, actionable recommendations. Keep it concise. Do NOT repeat my prompt.")
+_WEEKLY_EXEC_TMPL = """
 You are a helpful health coach. Do NOT echo my instructions.
 Using the following weekly data, write a brief report with:
 - Daily averages
@@ -248,39 +369,60 @@ Using the following weekly data, write a brief report with:
 - 2–3 concrete recommendations
 
 Data:
-- Steps: {d.get('steps', 0)} total
-- Sleep: {d.get('sleep_hours', 0)} hours total
-- Workouts: {d.get('workouts', 0)} sessions
-- Water: {d.get('water_liters', 0)} liters
+- Steps: {steps} total
+- Sleep: {sleep_hours} hours total
+- Workouts: {workouts} sessions
+- Water: {water_liters} liters
 """
+
+# /health timestamp, re-formatted at most once per second: [epoch_second, iso_string]
+_last_ts: List[Any] = [0, ""]
+
+def _health_timestamp() -> str:
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts[0] = now
+        _last_ts[1] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+    return _last_ts[1]
+
+@app.get("/health", dependencies=[Depends(require_api_key)] if API_KEY else None)
+async def health():
+    return {"status": "healthy", "roma_available": app.state.roma_ok, "timestamp": _health_timestamp()}
+
+@app.post("/weekly-report")
+async def weekly_report(request: Request, save: bool = Query(False)):
+    d = await _read_health_data(request)
+    steps = d.get("steps", 0)
+    sleep_hours = d.get("sleep_hours", 0)
+    workouts = d.get("workouts", 0)
+    water_liters = d.get("water_liters", 0)
+
+    a1 = await _roma_analysis(d, "weekly health metrics", goal=_WEEKLY_GOAL)
+    if a1:
+        text = a1
+    else:
+        goal_exec = _WEEKLY_EXEC_TMPL.format(
+            steps=steps, sleep_hours=sleep_hours, workouts=workouts, water_liters=water_liters
+        )
         a2 = await _roma_execute(goal_exec)
-        text = a2 if a2 else _fallback_weekly(d)
+        text = a2 if a2 else fallback_weekly(d)
 
     metrics = {
-        "daily_steps_avg": round(d.get("steps", 0)/7, 0) if d.get("steps") else 0,
-        "daily_sleep_avg": round(d.get("sleep_hours", 0)/7, 1) if d.get("sleep_hours") else 0.0,
-        "workouts": int(d.get("workouts", 0) or 0),
-        "water_liters": float(d.get("water_liters", 0) or 0.0),
+        "daily_steps_avg": round(steps/7, 0) if steps else 0,
+        "daily_sleep_avg": round(sleep_hours/7, 1) if sleep_hours else 0.0,
+        "workouts": int(workouts or 0),
+        "water_liters": float(water_liters or 0.0),
     }
 
     report_id = None
     if save:
-        rec = ReportDB(
-            kind="weekly",
-            input_json=json.dumps(d),
-            output_text=text,
-            metrics_json=json.dumps(metrics)
-        )
-        db.add(rec)
-        db.commit()
-        db.refresh(rec)
-        report_id = rec.id
+        report_id = await _save_report("weekly", json.dumps(d), text, json.dumps(metrics))
 
     return {"status": "success", "report": text, "metrics": metrics, "data_analyzed": d, "report_id": report_id}
 
 @app.post("/analyze")
-async def analyze(request: HealthData, save: bool = Query(False), db: Session = Depends(get_db)):
-    d = request.data
+async def analyze(request: Request, save: bool = Query(False)):
+    d = await _read_health_data(request)
     a1 = await _roma_analysis(d, "health metrics",
                               goal="Provide key observations, areas of concern, positive trends. Return brief text.")
     if a1 and isinstance(a1, str):
@@ -295,14 +437,13 @@ async def analyze(request: HealthData, save: bool = Query(False), db: Session =
 
     report_id = None
     if save:
-        rec = ReportDB(kind="analyze", input_json=json.dumps(d), output_text=text, metrics_json=None)
-        db.add(rec); db.commit(); db.refresh(rec); report_id = rec.id
+        report_id = await _save_report("analyze", json.dumps(d), text)
 
     return {"status": "success", "analysis": text if isinstance(text, str) else str(text), "report_id": report_id}
 
 # -------- NEW: /chat (AI coaching) --------
 @app.post("/chat")
-async def chat(msg: ChatMessage, save: bool = Query(False), db: Session = Depends(get_db)):
+async def chat(msg: ChatMessage, save: bool = Query(False)):
     prompt = (
         "You are a supportive, concise health coach. Answer helpfully in 2–4 sentences. "
         "Avoid repeating the user's message. Respond to:\n\n"
@@ -313,8 +454,7 @@ async def chat(msg: ChatMessage, save: bool = Query(False), db: Session = Depend
 
     report_id = None
     if save or msg.save:
-        rec = ReportDB(kind="chat", input_json=json.dumps({"message": msg.message}), output_text=reply, metrics_json=None)
-        db.add(rec); db.commit(); db.refresh(rec); report_id = rec.id
+        report_id = await _save_report("chat", json.dumps({"message": msg.message}), reply)
 
     return {"status": "success", "reply": reply, "report_id": report_id}
 
@@ -378,4 +518,5 @@ def delete_report(report_id: int, db: Session = Depends(get_db)):
 # ----------------- Entrypoint -----------------
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools",
+                workers=int(os.getenv("WEB_CONCURRENCY", "4")))
@@ -4,63 +4,323 @@ REAL Sentient ROMA Health Agents with LLM Fallback Support
 Updated to use the LLM fallback system for reliable AI calls
 """
 
-from typing import Any, Dict, List, Optional
-import os, json
-from datetime import datetime
-from storage.db import save_report
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from cachetools import TTLCache
+import os, hashlib, logging, threading, atexit, asyncio, queue
+from concurrent.futures import Future
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict, ValidationError
+import time
+from storage.db import HealthDatabase
+
+log = logging.getLogger("roma.health")
 
 # Import the fallback system
 try:
-    from llm_fallback import call_llm_with_fallback
+    from llm_fallback import call_llm_with_fallback, stream_llm_with_fallback
     FALLBACK_AVAILABLE = True
 except ImportError:
     FALLBACK_AVAILABLE = False
     # Fallback to direct litellm if module not available
+    import functools
     from litellm import completion
     
     OPENROUTER_KEY = os.getenv("OPENROUTER_API_KEY")
     MODEL = os.getenv("DEFAULT_MODEL", "gpt-3.5-turbo")
+    # Provider settings bound once at import; None when no key is configured
+    _completion = functools.partial(
+        completion, model=MODEL, api_key=OPENROUTER_KEY, base_url="https://openrouter.ai/api/v1"
+    ) if OPENROUTER_KEY else None
+    if _completion is None:
+        log.warning("No LLM provider configured: set OPENROUTER_API_KEY or install llm_fallback")
+
+# Small, fast models for the short structured decisions; the executors keep the
+# default model. With the fallback system these select its cheapest-first tier.
+ATOMIZER_MODEL = os.getenv("ATOMIZER_MODEL", "openai/gpt-4o-mini")
+PLANNER_MODEL = os.getenv("PLANNER_MODEL", "openai/gpt-4o-mini")
+
+# Comprehensive analyses run as a single FusedAnalysisAgent call unless disabled
+_FUSED_ANALYSIS = os.getenv("ROMA_FUSED_ANALYSIS", "1") != "0"
+
+# Content-addressed cache of LLM replies: the agent prompts are templates over a
+# handful of metrics, so repeat reports reuse the same (system, prompt) pairs.
+# LRU-bounded, and entries expire so advice doesn't outlive a day by default.
+_LLM_CACHE_SIZE = 1024
+_LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+_LLM_CACHE: TTLCache = TTLCache(maxsize=_LLM_CACHE_SIZE, ttl=_LLM_CACHE_TTL_SECONDS)
+_LLM_CACHE_LOCK = threading.Lock()
+_LLM_CACHE_NAMESPACE = "fallback" if FALLBACK_AVAILABLE else MODEL
+# Calls currently on the wire, by cache key: concurrent requests for the same
+# prompt (e.g. several users posting the same weekly numbers) share one round-trip
+_LLM_INFLIGHT: Dict[str, "Future[str]"] = {}
+# Replies starting with these are error strings and must not be cached
+_LLM_ERROR_PREFIXES = ("Error:", "LLM error:", "LLM fallback error:")
+
+# OpenAI-style JSON mode: the model must emit one parseable JSON object. drop_params
+# lets providers without response_format support ignore it instead of erroring.
+_JSON_MODE_PARAMS = {"response_format": {"type": "json_object"}, "drop_params": True}
+# Greedy sampling plus a fixed seed (where the provider honours it) for the
+# classification-style calls, so repeat inputs get repeatable replies
+_DETERMINISTIC_PARAMS = {"seed": 42, "drop_params": True}
+
+def _llm_cache_key(prompt: str, system_prompt: str, json_mode: bool = False, model: Optional[str] = None,
+                   temperature: float = 0.7) -> str:
+    raw = f"{_LLM_CACHE_NAMESPACE}|{model or ''}|{int(json_mode)}|{temperature}|{system_prompt}|{prompt}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def _ask_llm(prompt: str, system_prompt: str = "", stream: bool = False, json_mode: bool = False,
+             model: Optional[str] = None, temperature: float = 0.7) -> str:
+    """Helper to call LLM with automatic fallback support, reusing cached and in-flight replies"""
+    key = _llm_cache_key(prompt, system_prompt, json_mode, model, temperature)
+    with _LLM_CACHE_LOCK:
+        cached = _LLM_CACHE.get(key)
+        if cached is not None:
+            return cached
+        pending = _LLM_INFLIGHT.get(key)
+        if pending is None:
+            pending = _LLM_INFLIGHT[key] = Future()
+            leader = True
+        else:
+            leader = False
+    
+    if not leader:
+        return pending.result()
+    
+    response = None
+    try:
+        response = _call_llm(prompt, system_prompt, stream, json_mode, model, temperature)
+    finally:
+        with _LLM_CACHE_LOCK:
+            if isinstance(response, str) and not response.startswith(_LLM_ERROR_PREFIXES):
+                _LLM_CACHE[key] = response
+            del _LLM_INFLIGHT[key]
+        pending.set_result(response if response is not None else "LLM error: call aborted")
+    return response
+
+def _messages(prompt: str, system_prompt: str = "") -> List[Dict[str, str]]:
+    user = {"role": "user", "content": prompt}
+    return [{"role": "system", "content": system_prompt}, user] if system_prompt else [user]
 
-def _ask_llm(prompt: str, system_prompt: str = "") -> str:
-    """Helper to call LLM with automatic fallback support"""
+def _call_llm(prompt: str, system_prompt: str = "", stream: bool = False, json_mode: bool = False,
+              model: Optional[str] = None, temperature: float = 0.7) -> str:
+    """Uncached LLM call with automatic fallback support"""
+    params: Dict[str, Any] = {"temperature": temperature}
+    if temperature == 0:
+        params.update(_DETERMINISTIC_PARAMS)
+    if stream:
+        params["stream"] = True
+    if json_mode:
+        params.update(_JSON_MODE_PARAMS)
     
     if FALLBACK_AVAILABLE:
         # Use the fallback system (preferred)
         try:
-            return call_llm_with_fallback(prompt, system_prompt, temperature=0.7)
+            # Providers are pinned to their own models, so a model request means "fast tier"
+            return call_llm_with_fallback(prompt, system_prompt, fast=model is not None, **params)
         except Exception as e:
             return f"LLM fallback error: {e}"
     else:
         # Direct call as backup
-        if not OPENROUTER_KEY:
+        if _completion is None:
             return "Error: No LLM provider configured"
+        if model:
+            params["model"] = model
         
         try:
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            resp = completion(
-                model=MODEL,
-                messages=messages,
-                api_key=OPENROUTER_KEY,
-                base_url="https://openrouter.ai/api/v1",
-                temperature=0.7
-            )
+            resp = _completion(messages=_messages(prompt, system_prompt), **params)
+            if stream:
+                return "".join(chunk["choices"][0]["delta"].get("content") or "" for chunk in resp)
             return resp["choices"][0]["message"]["content"]
         except Exception as e:
             return f"LLM error: {e}"
 
-# Rest of your existing agent classes remain the same...
-class HealthAtomizer:
-    """ROMA Atomizer with LLM fallback support"""
+# Prompt tokens drive both latency and cost: embed data as compact JSON (no
+# indentation whitespace) and cap it so an oversized payload can't run away.
+_MAX_PROMPT_JSON_CHARS = 4000
+
+def _stream_llm(prompt: str, system_prompt: str = "", temperature: float = 0.7) -> Iterator[str]:
+    """Yield reply text as the provider streams it (uncached: for live responses)"""
+    if FALLBACK_AVAILABLE:
+        yield from stream_llm_with_fallback(prompt, system_prompt, temperature=temperature)
+        return
+    if _completion is None:
+        yield "Error: No LLM provider configured"
+        return
     
-    def is_atomic(self, task: Dict[str, Any]) -> bool:
-        task_description = task.get("description", str(task))
-        task_data = task.get("data", {})
-        
-        system_prompt = """You are the Atomizer in a ROMA health analysis system.
+    try:
+        for chunk in _completion(messages=_messages(prompt, system_prompt), temperature=temperature, stream=True):
+            content = chunk["choices"][0]["delta"].get("content")
+            if content:
+                yield content
+    except Exception as e:
+        yield f"LLM error: {e}"
+
+def _prompt_json(obj: Any) -> str:
+    """Compact JSON for interpolating into prompts"""
+    text = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    if len(text) > _MAX_PROMPT_JSON_CHARS:
+        return text[:_MAX_PROMPT_JSON_CHARS] + "...(truncated)"
+    return text
+
+def _task_data_json(task: Dict[str, Any]) -> str:
+    """The task's data as prompt JSON, reusing the copy the runner serialized up front"""
+    return task.get("_data_json") or _prompt_json(task.get("data", {}))
+
+# Schemas for the agents' JSON replies. Parsing goes straight from the reply text
+# through pydantic-core; a reply that isn't JSON or has mistyped fields is rejected
+# explicitly and the agent uses its canned result instead.
+class _Reply(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+class AtomizerReply(_Reply):
+    is_atomic: bool = False
+    reasoning: str = "No reasoning provided"
+
+class PlanReply(_Reply):
+    subtasks: List[Dict[str, Any]] = []
+    reasoning: str = "No planning reasoning"
+
+class ValidationReply(_Reply):
+    validation_status: str = "processed"
+    data_quality_score: Union[int, float] = 75
+    missing_fields: List[Any] = []
+    health_flags: List[Any] = []
+    recommendations: List[Any] = []
+    normalized_data: Dict[str, Any] = {}
+
+class AnalysisReply(_Reply):
+    performance_analysis: str = ""
+    key_insights: List[Any] = []
+    strengths: List[Any] = []
+    improvement_areas: List[Any] = []
+    trend_analysis: str = ""
+    risk_factors: List[Any] = []
+    next_week_targets: Dict[str, Any] = {}
+
+class IngestMetricsReply(_Reply):
+    validation_result: Optional[ValidationReply] = None
+    analysis_result: Optional[AnalysisReply] = None
+
+class CoachingReply(_Reply):
+    coaching_response: str = ""
+    key_recommendations: List[Any] = []
+    weekly_focus: List[Any] = []
+    motivation_message: str = ""
+    specific_actions: List[Any] = []
+    success_tips: List[Any] = []
+    check_in_questions: List[Any] = []
+
+class ReportReply(_Reply):
+    executive_summary: str = ""
+    week_highlights: List[Any] = []
+    areas_for_improvement: List[Any] = []
+    health_score_explanation: str = ""
+    weekly_achievements: List[Any] = []
+    concerns_to_monitor: List[Any] = []
+    next_week_plan: Dict[str, Any] = {}
+    long_term_recommendations: List[Any] = []
+
+class FusedAnalysisReply(IngestMetricsReply):
+    coaching_result: Optional[CoachingReply] = None
+    report_result: Optional[ReportReply] = None
+
+def _parse_reply(schema: Type[_Reply], reply: str) -> Optional[Dict[str, Any]]:
+    """The reply's fields as a dict (only those the model sent), or None if it doesn't fit the schema"""
+    try:
+        return schema.model_validate_json(reply).model_dump(exclude_unset=True)
+    except ValidationError:
+        return None
+
+# Plan templates keyed by task shape (kind + data keys): tasks of the same shape
+# decompose the same way, so only the first of each shape pays for a Planner call.
+# Least-frequently-used shapes are evicted first.
+_PLAN_CACHE_SIZE = 128
+_PLAN_CACHE: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+_PLAN_CACHE_HITS: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+_PLAN_CACHE_LOCK = threading.Lock()
+
+def _plan_shape(task: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+    task_data = task.get("data", {})
+    keys = tuple(sorted(map(str, task_data))) if isinstance(task_data, dict) else ()
+    return str(task.get("kind", "")), keys
+
+def _get_plan_template(shape: Tuple[str, Tuple[str, ...]]) -> Optional[List[Dict[str, Any]]]:
+    with _PLAN_CACHE_LOCK:
+        template = _PLAN_CACHE.get(shape)
+        if template is not None:
+            _PLAN_CACHE_HITS[shape] += 1
+        return template
+
+def _put_plan_template(shape: Tuple[str, Tuple[str, ...]], template: List[Dict[str, Any]]) -> None:
+    with _PLAN_CACHE_LOCK:
+        if shape not in _PLAN_CACHE and len(_PLAN_CACHE) >= _PLAN_CACHE_SIZE:
+            coldest = min(_PLAN_CACHE_HITS, key=_PLAN_CACHE_HITS.__getitem__)
+            del _PLAN_CACHE[coldest], _PLAN_CACHE_HITS[coldest]
+        _PLAN_CACHE[shape] = template
+        _PLAN_CACHE_HITS.setdefault(shape, 0)
+
+def _bind_plan(template: List[Dict[str, Any]], task_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Fresh subtask dicts for this task; templates never carry another task's data"""
+    return [{**subtask, "data": subtask.get("data", task_data)} for subtask in template]
+
+# Report persistence runs off the agents' critical path: one writer thread drains
+# the queue and lands whatever has piled up (up to a batch) in a single transaction,
+# so concurrent reports share one commit. Flushed on interpreter exit.
+_REPORT_BATCH_SIZE = 50
+_REPORT_QUEUE: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+
+def _report_writer() -> None:
+    # The writer owns its event loop, and with it the database connection
+    loop = asyncio.new_event_loop()
+    db = None
+    while True:
+        item = _REPORT_QUEUE.get()
+        batch = []
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= _REPORT_BATCH_SIZE:
+                break
+            try:
+                item = _REPORT_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+        if batch:
+            try:
+                db = db or HealthDatabase()
+                loop.run_until_complete(db.save_reports(batch))
+            except Exception as e:
+                log.warning("Failed to save %d report(s): %s", len(batch), e)
+        if item is None:
+            if db is not None:
+                loop.run_until_complete(db.close())
+            loop.close()
+            return
+
+# Started on the first queued report, so importing the agents has no side effects
+_REPORT_WRITER: Optional[threading.Thread] = None
+_REPORT_WRITER_LOCK = threading.Lock()
+
+def _flush_reports() -> None:
+    _REPORT_QUEUE.put(None)
+    _REPORT_WRITER.join()
+
+def _queue_report(data: Dict[str, Any], report_result: Dict[str, Any]) -> None:
+    global _REPORT_WRITER
+    if _REPORT_WRITER is None:
+        with _REPORT_WRITER_LOCK:
+            if _REPORT_WRITER is None:
+                writer = threading.Thread(target=_report_writer, name="report-writer", daemon=True)
+                writer.start()
+                _REPORT_WRITER = writer
+                atexit.register(_flush_reports)
+    _REPORT_QUEUE.put({"input": data, "report": report_result})
+
+# Task kinds whose atomicity is known without asking the LLM
+_ATOMIC_KINDS = frozenset({"ingest", "metrics", "ingest_metrics", "coach", "report", "fused"})
+_COMPLEX_KINDS = frozenset({"comprehensive", "comprehensive_health_analysis", "full_analysis", "weekly"})
+
+_ATOMIZER_SYSTEM = """You are the Atomizer in a ROMA health analysis system.
 
 Determine if a task is ATOMIC (single agent) or COMPLEX (needs decomposition).
 
@@ -78,6 +338,29 @@ COMPLEX tasks:
 
 Respond with JSON: {"is_atomic": boolean, "reasoning": "explanation"}"""
 
+# Rest of your existing agent classes remain the same...
+class HealthAtomizer:
+    """ROMA Atomizer with LLM fallback support"""
+    
+    def is_atomic(self, task: Dict[str, Any]) -> bool:
+        return self.decide(task)[0]
+    
+    def decide(self, task: Dict[str, Any]) -> Tuple[bool, bool]:
+        """(is_atomic, cacheable): the failure default is not a real decision, so not cacheable"""
+        task_description = task.get("description", str(task))
+        task_data = task.get("data", {})
+        
+        # Cheap rule-based gate; the LLM only sees tasks these rules can't decide
+        kind = str(task.get("kind", "")).lower()
+        if kind in _ATOMIC_KINDS:
+            return True, True
+        if kind in _COMPLEX_KINDS:
+            log.debug("🔍 Atomizer: Task is COMPLEX - '%s' tasks always decompose", kind)
+            return False, True
+        if isinstance(task_data, dict) and len(task_data) <= 2 and len(str(task_data)) < 200:
+            log.debug("🔍 Atomizer: Task is ATOMIC - small single-domain payload")
+            return True, True
+        
         prompt = f"""
         Analyze this health task for atomicity:
         
@@ -89,107 +372,166 @@ Respond with JSON: {"is_atomic": boolean, "reasoning": "explanation"}"""
         """
         
         try:
-            response = _ask_llm(prompt, system_prompt)
-            result = json.loads(response)
+            response = _ask_llm(prompt, _ATOMIZER_SYSTEM, json_mode=True, model=ATOMIZER_MODEL, temperature=0.0)
+            result = AtomizerReply.model_validate_json(response)
             
-            is_atomic = result.get("is_atomic", False)
-            reasoning = result.get("reasoning", "No reasoning provided")
+            is_atomic = result.is_atomic
+            reasoning = result.reasoning
             
-            print(f"🔍 Atomizer: Task is {'ATOMIC' if is_atomic else 'COMPLEX'} - {reasoning}")
-            return is_atomic
+            log.debug("🔍 Atomizer: Task is %s - %s", 'ATOMIC' if is_atomic else 'COMPLEX', reasoning)
+            return is_atomic, True
             
         except Exception as e:
-            print(f"⚠️ Atomizer failed, defaulting to COMPLEX: {e}")
-            return False
+            log.warning("⚠️ Atomizer failed, defaulting to COMPLEX: %s", e)
+            return False, False
 
-class HealthPlanner:
-    """ROMA Planner with LLM fallback support"""
-    
-    def plan(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
-        task_description = task.get("description", str(task))
-        task_data = task.get("data", {})
-        
-        system_prompt = """You are the Planner in a ROMA health analysis system.
+def standard_plan(task_data: Dict[str, Any], fused: bool = _FUSED_ANALYSIS) -> List[Dict[str, Any]]:
+    """The fixed comprehensive-analysis plan: one fused subtask, or the per-stage pipeline"""
+    if fused:
+        return [{
+            "id": "fused_analysis",
+            "kind": "fused",
+            "description": "Validate, analyze, coach and report on health data in one pass",
+            "depends_on": [],
+            "priority": 1,
+            "data": task_data
+        }]
+    # Validation and metrics share one fused LLM call; none of these agents reads
+    # another's output (coach/report prompt from the raw metrics), so they carry
+    # no dependencies and all three LLM calls go out in one concurrent wave.
+    return [
+        {
+            "id": "data_and_metrics",
+            "kind": "ingest_metrics", 
+            "description": "Validate health data and calculate comprehensive health metrics",
+            "depends_on": [],
+            "priority": 1,
+            "data": task_data
+        },
+        {
+            "id": "personalized_coaching", 
+            "kind": "coach",
+            "description": "Generate personalized health recommendations",
+            "depends_on": [],
+            "priority": 3,
+            "data": {"message": "Provide weekly health coaching based on metrics"}
+        },
+        {
+            "id": "comprehensive_report",
+            "kind": "report",
+            "description": "Create comprehensive health report",
+            "depends_on": [],
+            "priority": 4,
+            "data": task_data
+        }
+    ]
+
+_PLANNER_SYSTEM = """You are the Planner in a ROMA health analysis system.
 
 Break complex health tasks into executable subtasks with proper dependencies.
 
 Available Agents:
 - DataIngestionAgent: Validates, normalizes health data
 - MetricsAnalysisAgent: Computes health metrics, adherence
+- IngestMetricsAgent: Validation and metrics together in one step (kind "ingest_metrics")
 - CoachingAgent: Provides personalized recommendations  
 - ReportingAgent: Creates comprehensive reports
 
 Respond with JSON: {"subtasks": [{"id": "unique_id", "kind": "agent_type", "description": "task_description", "depends_on": ["task_ids"], "priority": 1-5}], "reasoning": "explanation"}"""
 
+class HealthPlanner:
+    """ROMA Planner with LLM fallback support"""
+    
+    def plan(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self.decide(task)[0]
+    
+    def decide(self, task: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+        """(subtasks, cacheable): the fallback plan after an LLM failure is not cacheable"""
+        task_description = task.get("description", str(task))
+        task_data = task.get("data", {})
+        
+        # The comprehensive analysis always decomposes the same way; one fused agent
+        # call replaces the planner round-trip and the per-stage calls
+        if _FUSED_ANALYSIS and task.get("kind") == "comprehensive_health_analysis":
+            return standard_plan(task_data), True
+        
+        shape = _plan_shape(task)
+        template = _get_plan_template(shape)
+        if template is not None:
+            log.debug("🗺️ Planner: Reusing cached plan (%s subtasks) for %s", len(template), shape[0] or 'task')
+            return _bind_plan(template, task_data), True
+        
         prompt = f"""
         Create an execution plan for this complex health analysis:
         
         Task: {task_description}
-        Data: {json.dumps(task_data, indent=2)}
+        Data: {_task_data_json(task)}
         
         Break this into subtasks that specialized agents can handle.
         Consider dependencies - data before metrics, metrics before coaching.
         """
         
         try:
-            response = _ask_llm(prompt, system_prompt)
-            result = json.loads(response)
+            response = _ask_llm(prompt, _PLANNER_SYSTEM, json_mode=True, model=PLANNER_MODEL, temperature=0.0)
+            result = PlanReply.model_validate_json(response)
             
-            subtasks = result.get("subtasks", [])
-            reasoning = result.get("reasoning", "No planning reasoning")
+            subtasks = result.subtasks
+            reasoning = result.reasoning
             
-            print(f"🗺️ Planner: Created {len(subtasks)} subtasks - {reasoning}")
+            log.debug("🗺️ Planner: Created %s subtasks - %s", len(subtasks), reasoning)
             
             # Ensure subtasks have required fields
             for i, subtask in enumerate(subtasks):
                 if "id" not in subtask:
                     subtask["id"] = f"subtask_{i}"
-                if "data" not in subtask:
-                    subtask["data"] = task_data
                 if "depends_on" not in subtask:
                     subtask["depends_on"] = []
                 if "priority" not in subtask:
                     subtask["priority"] = 3
             
-            return subtasks
+            # Cache the template before data is bound so hits get their own task's data
+            if subtasks:
+                _put_plan_template(shape, subtasks)
+            return _bind_plan(subtasks, task_data), True
             
         except Exception as e:
-            print(f"⚠️ Planner failed, using fallback plan: {e}")
+            log.warning("⚠️ Planner failed, using fallback plan: %s", e)
             # Fallback to standard health analysis pipeline
-            return [
-                {
-                    "id": "data_validation",
-                    "kind": "ingest", 
-                    "description": "Validate and normalize health data",
-                    "depends_on": [],
-                    "priority": 1,
-                    "data": task_data
-                },
-                {
-                    "id": "health_metrics",
-                    "kind": "metrics",
-                    "description": "Calculate comprehensive health metrics",
-                    "depends_on": ["data_validation"],
-                    "priority": 2,
-                    "data": task_data
-                },
-                {
-                    "id": "personalized_coaching", 
-                    "kind": "coach",
-                    "description": "Generate personalized health recommendations",
-                    "depends_on": ["health_metrics"],
-                    "priority": 3,
-                    "data": {"message": "Provide weekly health coaching based on metrics"}
-                },
-                {
-                    "id": "comprehensive_report",
-                    "kind": "report",
-                    "description": "Create comprehensive health report",
-                    "depends_on": ["health_metrics", "personalized_coaching"],
-                    "priority": 4,
-                    "data": task_data
-                }
-            ]
+            return standard_plan(task_data, fused=False), False
+
+def _health_fields(data: Dict[str, Any]) -> Tuple[int, float, int, float]:
+    """(steps, sleep_hours, workouts, water_liters) with missing values as zero"""
+    return (int(data.get("steps", 0) or 0), float(data.get("sleep_hours", 0) or 0.0),
+            int(data.get("workouts", 0) or 0), float(data.get("water_liters", 0) or 0.0))
+
+def _validation_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    steps, sleep_hours, workouts, water_liters = _health_fields(data)
+    return {
+        "steps": steps,
+        "sleep_hours": sleep_hours,
+        "workouts": workouts,
+        "water_liters": water_liters,
+        "data_quality": "good" if all([steps > 0, sleep_hours > 0, workouts >= 0, water_liters > 0]) else "incomplete",
+        "total_data_points": len([x for x in [steps, sleep_hours, workouts, water_liters] if x > 0])
+    }
+
+def _default_validation(validation_summary: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "validation_status": "processed",
+        "data_quality_score": 75,
+        "missing_fields": [],
+        "health_flags": [],
+        "recommendations": ["Continue tracking consistently"],
+        "normalized_data": validation_summary
+    }
+
+_INGEST_SYSTEM = """You are a health data validation expert. Analyze health data for:
+1. Completeness and quality
+2. Concerning values that need attention  
+3. Data consistency and patterns
+4. Missing critical information
+
+Provide practical validation insights, not medical diagnosis."""
 
 class DataIngestionAgent:
     """ROMA Executor: Data validation with LLM fallback"""
@@ -206,33 +548,13 @@ class DataIngestionAgent:
             }
         
         # Extract basic health metrics
-        steps = int(data.get("steps", 0) or 0)
-        sleep_hours = float(data.get("sleep_hours", 0) or 0.0)
-        workouts = int(data.get("workouts", 0) or 0)
-        water_liters = float(data.get("water_liters", 0) or 0.0)
-        
-        validation_summary = {
-            "steps": steps,
-            "sleep_hours": sleep_hours,
-            "workouts": workouts,
-            "water_liters": water_liters,
-            "data_quality": "good" if all([steps > 0, sleep_hours > 0, workouts >= 0, water_liters > 0]) else "incomplete",
-            "total_data_points": len([x for x in [steps, sleep_hours, workouts, water_liters] if x > 0])
-        }
+        validation_summary = _validation_summary(data)
         
         # AI validation with fallback
-        system_prompt = """You are a health data validation expert. Analyze health data for:
-1. Completeness and quality
-2. Concerning values that need attention  
-3. Data consistency and patterns
-4. Missing critical information
-
-Provide practical validation insights, not medical diagnosis."""
-
         prompt = f"""
         Validate this health data and provide insights:
         
-        {json.dumps(validation_summary, indent=2)}
+        {_prompt_json(validation_summary)}
         
         Respond with JSON:
         {{
@@ -245,19 +567,9 @@ Provide practical validation insights, not medical diagnosis."""
         }}
         """
         
-        ai_validation = _ask_llm(prompt, system_prompt)
+        ai_validation = _ask_llm(prompt, _INGEST_SYSTEM, json_mode=True, temperature=0.0)
         
-        try:
-            validation_result = json.loads(ai_validation)
-        except:
-            validation_result = {
-                "validation_status": "processed",
-                "data_quality_score": 75,
-                "missing_fields": [],
-                "health_flags": [],
-                "recommendations": ["Continue tracking consistently"],
-                "normalized_data": validation_summary
-            }
+        validation_result = _parse_reply(ValidationReply, ai_validation) or _default_validation(validation_summary)
         
         return {
             "stage": "ingest",
@@ -269,44 +581,69 @@ Provide practical validation insights, not medical diagnosis."""
             "normalized_data": validation_result.get("normalized_data", validation_summary)
         }
 
-class MetricsAnalysisAgent:
-    """ROMA Executor: Health metrics with LLM fallback"""
+# Score targets for (steps, water_liters, sleep_hours); workouts add 15 points to activity
+_SCORE_TARGETS = np.array([10000.0, 14.0, 56.0])
+_SCORE_SCALE = 100.0 / _SCORE_TARGETS  # points per unit, so scoring is one multiply
+_WORKOUT_POINTS = 15.0
+# Scalar copies for single entries, where numpy's per-call dispatch outweighs three multiplies
+_STEPS_SCALE, _WATER_SCALE, _SLEEP_SCALE = _SCORE_SCALE.tolist()
+
+def _metric_scores(raw: np.ndarray, workouts: np.ndarray) -> np.ndarray:
+    """(activity, hydration, sleep) scores, clipped to 0-100, for rows of (steps, water, sleep)"""
+    scores = raw * _SCORE_SCALE
+    scores[..., 0] += workouts * _WORKOUT_POINTS
+    return np.clip(scores, 0.0, 100.0, out=scores)
+
+def metrics_scores_batch(rows: List[Dict[str, Any]]) -> np.ndarray:
+    """Overall health score for many entries in one vectorized pass"""
+    raw = np.array([[float(r.get("steps", 0) or 0), float(r.get("water_liters", 0) or 0.0),
+                     float(r.get("sleep_hours", 0) or 0.0)] for r in rows]).reshape(-1, 3)
+    workouts = np.array([float(int(r.get("workouts", 0) or 0)) for r in rows])
+    return _metric_scores(raw, workouts).mean(axis=1)
+
+def _metrics_summary(data: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+    """Weekly metrics summary and the unrounded overall score"""
+    steps, sleep_hours, workouts, water_liters = _health_fields(data)
     
-    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        data = task.get("data", {})
-        
-        # Extract metrics
-        steps = int(data.get("steps", 0) or 0)
-        sleep_hours = float(data.get("sleep_hours", 0) or 0.0)
-        workouts = int(data.get("workouts", 0) or 0)
-        water_liters = float(data.get("water_liters", 0) or 0.0)
-        
-        # Calculate scores
-        activity_score = min(100, (steps / 10000) * 100 + workouts * 15)
-        hydration_score = min(100, (water_liters / 14.0) * 100)
-        sleep_score = min(100, (sleep_hours / 56.0) * 100)
-        overall_score = (activity_score + hydration_score + sleep_score) / 3
-        
-        metrics_summary = {
-            "steps": steps,
-            "sleep_hours": sleep_hours,
-            "workouts": workouts, 
-            "water_liters": water_liters,
-            "scores": {
-                "activity": round(activity_score, 1),
-                "hydration": round(hydration_score, 1), 
-                "sleep": round(sleep_score, 1),
-                "overall": round(overall_score, 1)
-            },
-            "weekly_averages": {
-                "daily_steps": round(steps / 7, 0),
-                "daily_sleep": round(sleep_hours / 7, 1),
-                "daily_water": round(water_liters / 7, 1)
-            }
+    # Calculate scores, clipped to 0-100 inline as in _metric_scores
+    activity_score = steps * _STEPS_SCALE + workouts * _WORKOUT_POINTS
+    hydration_score = water_liters * _WATER_SCALE
+    sleep_score = sleep_hours * _SLEEP_SCALE
+    activity_score = 100.0 if activity_score > 100.0 else (activity_score if activity_score > 0.0 else 0.0)
+    hydration_score = 100.0 if hydration_score > 100.0 else (hydration_score if hydration_score > 0.0 else 0.0)
+    sleep_score = 100.0 if sleep_score > 100.0 else (sleep_score if sleep_score > 0.0 else 0.0)
+    overall_score = (activity_score + hydration_score + sleep_score) / 3
+    
+    return {
+        "steps": steps,
+        "sleep_hours": sleep_hours,
+        "workouts": workouts, 
+        "water_liters": water_liters,
+        "scores": {
+            "activity": round(activity_score, 1),
+            "hydration": round(hydration_score, 1), 
+            "sleep": round(sleep_score, 1),
+            "overall": round(overall_score, 1)
+        },
+        "weekly_averages": {
+            "daily_steps": round(steps / 7, 0),
+            "daily_sleep": round(sleep_hours / 7, 1),
+            "daily_water": round(water_liters / 7, 1)
         }
-        
-        # AI analysis with fallback
-        system_prompt = """You are a health metrics analyst. Provide data-driven insights about:
+    }, overall_score
+
+def _default_analysis(overall_score: float) -> Dict[str, Any]:
+    return {
+        "performance_analysis": "Metrics calculated successfully",
+        "key_insights": ["Activity and sleep data processed", "Hydration levels tracked"],
+        "strengths": ["Consistent data tracking"],
+        "improvement_areas": ["Focus on target achievement"],
+        "trend_analysis": "Baseline established for future comparison",
+        "risk_factors": [],
+        "next_week_targets": {"overall_score": min(100, overall_score + 5)}
+    }
+
+_METRICS_SYSTEM = """You are a health metrics analyst. Provide data-driven insights about:
 1. Performance against health targets
 2. Patterns and trends in the data
 3. Areas of strength and improvement  
@@ -315,37 +652,40 @@ class MetricsAnalysisAgent:
 
 Focus on objective analysis, avoid medical advice."""
 
-        prompt = f"""
+# Prompt templates: constant text around the per-call JSON payload, built once
+_METRICS_PROMPT_HEAD = """
         Analyze these weekly health metrics:
         
-        {json.dumps(metrics_summary, indent=2)}
+        """
+_METRICS_PROMPT_TAIL = """
         
         Provide comprehensive analysis as JSON:
-        {{
+        {
             "performance_analysis": "detailed assessment",
             "key_insights": ["insight1", "insight2", "insight3"],
             "strengths": ["strength1", "strength2"],
             "improvement_areas": ["area1", "area2"],
             "trend_analysis": "patterns observed",
             "risk_factors": ["risk1", "risk2"],
-            "next_week_targets": {{"metric": target}}
-        }}
+            "next_week_targets": {"metric": target}
+        }
         """
+
+class MetricsAnalysisAgent:
+    """ROMA Executor: Health metrics with LLM fallback"""
+    
+    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        data = task.get("data", {})
         
-        ai_analysis = _ask_llm(prompt, system_prompt)
+        # Extract metrics and calculate scores
+        metrics_summary, overall_score = _metrics_summary(data)
         
-        try:
-            analysis_result = json.loads(ai_analysis)
-        except:
-            analysis_result = {
-                "performance_analysis": "Metrics calculated successfully",
-                "key_insights": ["Activity and sleep data processed", "Hydration levels tracked"],
-                "strengths": ["Consistent data tracking"],
-                "improvement_areas": ["Focus on target achievement"],
-                "trend_analysis": "Baseline established for future comparison",
-                "risk_factors": [],
-                "next_week_targets": {"overall_score": min(100, overall_score + 5)}
-            }
+        # AI analysis with fallback
+        prompt = _METRICS_PROMPT_HEAD + _prompt_json(metrics_summary) + _METRICS_PROMPT_TAIL
+        
+        ai_analysis = _ask_llm(prompt, _METRICS_SYSTEM, json_mode=True, temperature=0.0)
+        
+        analysis_result = _parse_reply(AnalysisReply, ai_analysis) or _default_analysis(overall_score)
         
         return {
             "stage": "metrics",
@@ -356,6 +696,98 @@ Focus on objective analysis, avoid medical advice."""
             "health_score": round(overall_score, 1)
         }
 
+_INGEST_METRICS_SYSTEM = """You are a health data validator and metrics analyst. In one pass:
+1. Check completeness, quality and concerning values in the data
+2. Assess performance against health targets
+3. Identify strengths, improvement areas and risk factors
+4. Give actionable, metrics-based recommendations
+
+Provide practical, objective insights, not medical diagnosis."""
+
+class IngestMetricsAgent:
+    """ROMA Executor: Data validation and metrics analysis in one LLM call"""
+    
+    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        data = task.get("data", {})
+        
+        if not isinstance(data, dict) or not data:
+            return {
+                "stage": "ingest_metrics",
+                "ok": False, 
+                "error": "No or invalid input data",
+                "agent": "IngestMetricsAgent"
+            }
+        
+        validation_summary = _validation_summary(data)
+        metrics_summary, overall_score = _metrics_summary(data)
+        
+        prompt = f"""
+        Validate and analyze this week's health data:
+        
+        Data quality: {validation_summary["data_quality"]} ({validation_summary["total_data_points"]}/4 fields present)
+        Metrics: {_prompt_json(metrics_summary)}
+        
+        Respond with JSON:
+        {{
+            "validation_result": {{
+                "validation_status": "good/warning/concerning",
+                "data_quality_score": 0-100,
+                "missing_fields": ["field1", "field2"],
+                "health_flags": ["flag1", "flag2"],
+                "recommendations": ["rec1", "rec2"],
+                "normalized_data": {{normalized version}}
+            }},
+            "analysis_result": {{
+                "performance_analysis": "detailed assessment",
+                "key_insights": ["insight1", "insight2", "insight3"],
+                "strengths": ["strength1", "strength2"],
+                "improvement_areas": ["area1", "area2"],
+                "trend_analysis": "patterns observed",
+                "risk_factors": ["risk1", "risk2"],
+                "next_week_targets": {{"metric": target}}
+            }}
+        }}
+        """
+        
+        combined = _ask_llm(prompt, _INGEST_METRICS_SYSTEM, json_mode=True, temperature=0.0)
+        
+        combined_result = _parse_reply(IngestMetricsReply, combined) or {}
+        validation_result = combined_result.get("validation_result") or _default_validation(validation_summary)
+        analysis_result = combined_result.get("analysis_result") or _default_analysis(overall_score)
+        
+        return {
+            "stage": "ingest_metrics",
+            "ok": True,
+            "agent": "IngestMetricsAgent",
+            "raw_data": data,
+            "validation_summary": validation_summary,
+            "ai_validation": validation_result,
+            "normalized_data": validation_result.get("normalized_data", validation_summary),
+            "metrics_summary": metrics_summary,
+            "ai_analysis": analysis_result,
+            "health_score": round(overall_score, 1)
+        }
+
+_COACH_SYSTEM = """You are an expert health and wellness coach. Provide:
+1. Personalized, actionable advice
+2. Motivational and supportive guidance
+3. Specific behavioral recommendations
+4. Weekly focus areas and goals
+5. Encouraging but realistic expectations
+
+Be warm, professional, and evidence-based. Avoid medical diagnosis."""
+
+def _default_coaching(user_message: str) -> Dict[str, Any]:
+    return {
+        "coaching_response": f"Great job tracking your health data! {user_message}",
+        "key_recommendations": ["Stay consistent with tracking", "Focus on gradual improvements", "Celebrate small wins"],
+        "weekly_focus": ["Consistency", "Balance"],
+        "motivation_message": "Every step towards better health counts. You're building great habits!",
+        "specific_actions": ["Track daily metrics", "Set realistic weekly goals", "Review progress regularly"],
+        "success_tips": ["Start small and build up", "Focus on consistency over perfection"],
+        "check_in_questions": ["How are you feeling about your progress?", "What's working well for you?"]
+    }
+
 class CoachingAgent:
     """ROMA Executor: AI coaching with fallback"""
     
@@ -371,20 +803,11 @@ class CoachingAgent:
             "water_liters": data.get("water_liters", 0)
         }
         
-        system_prompt = """You are an expert health and wellness coach. Provide:
-1. Personalized, actionable advice
-2. Motivational and supportive guidance
-3. Specific behavioral recommendations
-4. Weekly focus areas and goals
-5. Encouraging but realistic expectations
-
-Be warm, professional, and evidence-based. Avoid medical diagnosis."""
-
         prompt = f"""
         Provide health coaching for this situation:
         
         Request: {user_message}
-        Health Context: {json.dumps(context_data, indent=2)}
+        Health Context: {_prompt_json(context_data)}
         
         Respond as JSON:
         {{
@@ -398,20 +821,9 @@ Be warm, professional, and evidence-based. Avoid medical diagnosis."""
         }}
         """
         
-        coaching_response = _ask_llm(prompt, system_prompt)
+        coaching_response = _ask_llm(prompt, _COACH_SYSTEM, json_mode=True)
         
-        try:
-            coaching_result = json.loads(coaching_response)
-        except:
-            coaching_result = {
-                "coaching_response": f"Great job tracking your health data! {user_message}",
-                "key_recommendations": ["Stay consistent with tracking", "Focus on gradual improvements", "Celebrate small wins"],
-                "weekly_focus": ["Consistency", "Balance"],
-                "motivation_message": "Every step towards better health counts. You're building great habits!",
-                "specific_actions": ["Track daily metrics", "Set realistic weekly goals", "Review progress regularly"],
-                "success_tips": ["Start small and build up", "Focus on consistency over perfection"],
-                "check_in_questions": ["How are you feeling about your progress?", "What's working well for you?"]
-            }
+        coaching_result = _parse_reply(CoachingReply, coaching_response) or _default_coaching(user_message)
         
         return {
             "stage": "coach",
@@ -420,14 +832,24 @@ Be warm, professional, and evidence-based. Avoid medical diagnosis."""
             "user_request": user_message,
             "coaching_result": coaching_result
         }
-
-class ReportingAgent:
-    """ROMA Executor: Report generation with fallback"""
     
-    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def stream(self, task: Dict[str, Any]) -> Iterator[str]:
+        """Conversational coaching reply, yielded token by token as the LLM produces it"""
         data = task.get("data", {})
+        user_message = data.get("message", "Weekly health coaching")
+        context = data.get("context") or ""
+        
+        prompt = f"""
+        Provide health coaching for this situation:
         
-        system_prompt = """You are a health report specialist. Create comprehensive reports that:
+        Request: {user_message}
+        Context: {context}
+        
+        Reply conversationally in plain text (no JSON), with 2-3 specific actions.
+        """
+        return _stream_llm(prompt, _COACH_SYSTEM)
+
+_REPORT_SYSTEM = """You are a health report specialist. Create comprehensive reports that:
 1. Synthesize all health data into clear insights
 2. Provide executive summary of health status
 3. Highlight key achievements and areas for improvement
@@ -436,63 +858,175 @@ class ReportingAgent:
 
 Make reports professional yet accessible."""
 
-        prompt = f"""
+_REPORT_PROMPT_HEAD = """
         Create a comprehensive weekly health report:
         
-        Health Data: {json.dumps(data, indent=2)}
+        Health Data: """
+_REPORT_PROMPT_TAIL = """
         
         Generate as JSON:
-        {{
+        {
             "executive_summary": "2-3 sentence overview",
             "week_highlights": ["highlight1", "highlight2", "highlight3"],
             "areas_for_improvement": ["area1", "area2"],
             "health_score_explanation": "why this score",
             "weekly_achievements": ["achievement1", "achievement2"],
             "concerns_to_monitor": ["concern1", "concern2"],
-            "next_week_plan": {{
+            "next_week_plan": {
                 "primary_goals": ["goal1", "goal2"],
                 "daily_actions": ["action1", "action2", "action3"],
                 "success_metrics": ["metric1", "metric2"]
-            }},
+            },
             "long_term_recommendations": ["rec1", "rec2", "rec3"]
-        }}
+        }
         """
+
+def _default_report() -> Dict[str, Any]:
+    return {
+        "executive_summary": "Health data tracked successfully for the week with areas for continued focus.",
+        "week_highlights": ["Consistent data tracking", "Health awareness maintained"],
+        "areas_for_improvement": ["Optimize daily routines", "Focus on consistency"],
+        "health_score_explanation": "Score reflects current tracking and baseline establishment",
+        "weekly_achievements": ["Data collection completed"],
+        "concerns_to_monitor": ["Maintain tracking consistency"],
+        "next_week_plan": {
+            "primary_goals": ["Continue tracking", "Improve consistency"],
+            "daily_actions": ["Log health metrics", "Stay hydrated", "Get adequate sleep"],
+            "success_metrics": ["Daily logging", "Target achievement"]
+        },
+        "long_term_recommendations": ["Build sustainable habits", "Focus on gradual improvement", "Regular progress reviews"]
+    }
+
+class ReportingAgent:
+    """ROMA Executor: Report generation with fallback"""
+    
+    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        data = task.get("data", {})
         
-        report_content = _ask_llm(prompt, system_prompt)
+        prompt = _REPORT_PROMPT_HEAD + _task_data_json(task) + _REPORT_PROMPT_TAIL
         
-        try:
-            report_result = json.loads(report_content)
-        except:
-            report_result = {
-                "executive_summary": "Health data tracked successfully for the week with areas for continued focus.",
-                "week_highlights": ["Consistent data tracking", "Health awareness maintained"],
-                "areas_for_improvement": ["Optimize daily routines", "Focus on consistency"],
-                "health_score_explanation": "Score reflects current tracking and baseline establishment",
-                "weekly_achievements": ["Data collection completed"],
-                "concerns_to_monitor": ["Maintain tracking consistency"],
-                "next_week_plan": {
-                    "primary_goals": ["Continue tracking", "Improve consistency"],
-                    "daily_actions": ["Log health metrics", "Stay hydrated", "Get adequate sleep"],
-                    "success_metrics": ["Daily logging", "Target achievement"]
-                },
-                "long_term_recommendations": ["Build sustainable habits", "Focus on gradual improvement", "Regular progress reviews"]
-            }
+        # Largest reply of the pipeline: stream it rather than wait on one buffered body
+        report_content = _ask_llm(prompt, _REPORT_SYSTEM, stream=True, json_mode=True)
         
-        # Save report to database
-        try:
-            report_text = json.dumps(report_result, indent=2)
-            report_id = save_report(data, report_text)
-        except Exception as e:
-            report_id = None
-            print(f"Failed to save report: {e}")
+        report_result = _parse_reply(ReportReply, report_content) or _default_report()
+        
+        # Save report to database in the background; its id is assigned when the batch lands
+        _queue_report(data, report_result)
         
         return {
             "stage": "report",
             "ok": True,
             "agent": "ReportingAgent",
             "report_result": report_result,
-            "report_id": report_id,
-            "generated_at": datetime.utcnow().isoformat()
+            "report_save": "queued",
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }
+
+_FUSED_SYSTEM = """You are a health analysis team in one: data validator, metrics analyst,
+wellness coach and report specialist. For the week's data, in a single response:
+1. Validate data completeness and quality
+2. Analyze performance against health targets
+3. Give personalized, actionable and encouraging coaching
+4. Write a comprehensive, accessible weekly report with a plan for next week
+
+Be objective, warm and evidence-based. Avoid medical diagnosis."""
+
+class FusedAnalysisAgent:
+    """ROMA Executor: validation, metrics, coaching and report from one LLM call"""
+    
+    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        data = task.get("data", {})
+        
+        if not isinstance(data, dict) or not data:
+            return {
+                "stage": "fused",
+                "ok": False, 
+                "error": "No or invalid input data",
+                "agent": "FusedAnalysisAgent"
+            }
+        
+        user_message = data.get("message", "Provide weekly health coaching based on metrics")
+        validation_summary = _validation_summary(data)
+        metrics_summary, overall_score = _metrics_summary(data)
+        
+        prompt = f"""
+        Analyze this week's health data end to end:
+        
+        Data quality: {validation_summary["data_quality"]} ({validation_summary["total_data_points"]}/4 fields present)
+        Metrics: {_prompt_json(metrics_summary)}
+        Coaching request: {user_message}
+        
+        Respond with JSON:
+        {{
+            "validation_result": {{
+                "validation_status": "good/warning/concerning",
+                "data_quality_score": 0-100,
+                "missing_fields": ["field1"],
+                "health_flags": ["flag1"],
+                "recommendations": ["rec1"],
+                "normalized_data": {{normalized version}}
+            }},
+            "analysis_result": {{
+                "performance_analysis": "detailed assessment",
+                "key_insights": ["insight1", "insight2"],
+                "strengths": ["strength1"],
+                "improvement_areas": ["area1"],
+                "trend_analysis": "patterns observed",
+                "risk_factors": ["risk1"],
+                "next_week_targets": {{"metric": target}}
+            }},
+            "coaching_result": {{
+                "coaching_response": "main response to user",
+                "key_recommendations": ["rec1", "rec2", "rec3"],
+                "weekly_focus": ["focus1", "focus2"],
+                "motivation_message": "encouraging message",
+                "specific_actions": ["action1", "action2"],
+                "success_tips": ["tip1"],
+                "check_in_questions": ["question1"]
+            }},
+            "report_result": {{
+                "executive_summary": "2-3 sentence overview",
+                "week_highlights": ["highlight1", "highlight2"],
+                "areas_for_improvement": ["area1"],
+                "health_score_explanation": "why this score",
+                "weekly_achievements": ["achievement1"],
+                "concerns_to_monitor": ["concern1"],
+                "next_week_plan": {{
+                    "primary_goals": ["goal1"],
+                    "daily_actions": ["action1", "action2", "action3"],
+                    "success_metrics": ["metric1"]
+                }},
+                "long_term_recommendations": ["rec1", "rec2", "rec3"]
+            }}
+        }}
+        """
+        
+        fused_content = _ask_llm(prompt, _FUSED_SYSTEM, stream=True, json_mode=True)
+        
+        fused_result = _parse_reply(FusedAnalysisReply, fused_content) or {}
+        validation_result = fused_result.get("validation_result") or _default_validation(validation_summary)
+        analysis_result = fused_result.get("analysis_result") or _default_analysis(overall_score)
+        coaching_result = fused_result.get("coaching_result") or _default_coaching(user_message)
+        report_result = fused_result.get("report_result") or _default_report()
+        
+        _queue_report(data, report_result)
+        
+        return {
+            "stage": "fused",
+            "ok": True,
+            "agent": "FusedAnalysisAgent",
+            "raw_data": data,
+            "validation_summary": validation_summary,
+            "ai_validation": validation_result,
+            "normalized_data": validation_result.get("normalized_data", validation_summary),
+            "metrics_summary": metrics_summary,
+            "ai_analysis": analysis_result,
+            "health_score": round(overall_score, 1),
+            "user_request": user_message,
+            "coaching_result": coaching_result,
+            "report_result": report_result,
+            "report_save": "queued",
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         }
 
 class HealthAggregator:
@@ -502,58 +1036,63 @@ class HealthAggregator:
         if not parts:
             return {"ok": False, "error": "No parts to aggregate"}
         
-        # Organize results by agent type
+        # Organize results by agent type (one pass; also feeds the execution summary)
         results_by_agent = {}
+        agent_results = {}
         for part in parts:
             agent = part.get("agent", part.get("stage", "unknown"))
             results_by_agent[agent] = part
+            agent_results[agent] = part.get("ok", False)
         
         # Extract key information
-        ingestion_result = results_by_agent.get("DataIngestionAgent", {})
-        metrics_result = results_by_agent.get("MetricsAnalysisAgent", {})
-        coaching_result = results_by_agent.get("CoachingAgent", {})
-        reporting_result = results_by_agent.get("ReportingAgent", {})
+        fused_result = results_by_agent.get("FusedAnalysisAgent") or results_by_agent.get("IngestMetricsAgent", {})
+        ingestion_result = results_by_agent.get("DataIngestionAgent", fused_result)
+        metrics_result = results_by_agent.get("MetricsAnalysisAgent", fused_result)
+        coaching_result = results_by_agent.get("CoachingAgent", fused_result)
+        reporting_result = results_by_agent.get("ReportingAgent", fused_result)
+        ai_validation = ingestion_result.get("ai_validation", {})
+        coaching = coaching_result.get("coaching_result", {})
+        report = reporting_result.get("report_result", {})
+        health_score = metrics_result.get("health_score", 75)
         
-        # Build comprehensive response without AI aggregation to avoid complexity
+        # Deterministic merge: every section is already structured agent output,
+        # so no LLM synthesis round-trip is spent here
         final_response = {
             "ok": True,
             "roma_execution": "completed_successfully",
             "framework": "Sentient ROMA with LLM Fallback",
             "execution_summary": {
                 "total_agents": len(parts),
-                "successful_agents": len([p for p in parts if p.get("ok", False)]),
-                "agent_results": {part.get("agent", part.get("stage", "unknown")): part.get("ok", False) for part in parts}
+                "successful_agents": sum(1 for p in parts if p.get("ok", False)),
+                "agent_results": agent_results
             },
             
             # Core data
             "validated_data": {
                 "profile": ingestion_result.get("normalized_data", {}),
-                "quality_score": ingestion_result.get("ai_validation", {}).get("data_quality_score", 75),
-                "warnings": ingestion_result.get("ai_validation", {}).get("health_flags", [])
+                "quality_score": ai_validation.get("data_quality_score", 75),
+                "warnings": ai_validation.get("health_flags", [])
             },
             
             # Metrics and performance
             "health_metrics": metrics_result.get("metrics_summary", {}),
-            "health_score": metrics_result.get("health_score", 75),
+            "health_score": health_score,
             "ai_insights": metrics_result.get("ai_analysis", {}),
             
             # Coaching and recommendations  
-            "coaching_recommendations": coaching_result.get("coaching_result", {}),
-            "comprehensive_report": reporting_result.get("report_result", {}),
+            "coaching_recommendations": coaching,
+            "comprehensive_report": report,
             
             # Quick access summary
             "summary": {
-                "health_score": metrics_result.get("health_score", 75),
+                "health_score": health_score,
                 "status": "Analysis completed with multi-agent coordination",
-                "top_recommendations": coaching_result.get("coaching_result", {}).get("key_recommendations", [])[:3],
-                "next_actions": reporting_result.get("report_result", {}).get("next_week_plan", {}).get("daily_actions", [])[:3]
+                "top_recommendations": coaching.get("key_recommendations", [])[:3],
+                "next_actions": report.get("next_week_plan", {}).get("daily_actions", [])[:3]
             },
             
             # Execution metadata
-            "agent_execution": {
-                agent: res.get("ok", False) 
-                for agent, res in results_by_agent.items()
-            }
+            "agent_execution": dict(agent_results)
         }
         
         return final_response
@@ -4,14 +4,94 @@ REAL Sentient ROMA Engine with Safety Depth Limits
 Fixed version that prevents infinite recursion while maintaining true ROMA functionality.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from graphlib import TopologicalSorter
+import asyncio
+import hashlib
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
+import orjson
 from roma_agents.sentient_health_agents import (
     HealthAtomizer, HealthPlanner, HealthAggregator,
-    DataIngestionAgent, MetricsAnalysisAgent, 
-    CoachingAgent, ReportingAgent
+    DataIngestionAgent, MetricsAnalysisAgent, IngestMetricsAgent,
+    CoachingAgent, ReportingAgent, FusedAnalysisAgent, _prompt_json, standard_plan
 )
 
+log = logging.getLogger("roma.runner")
+
+# Per-subtask deadline, counted from when a worker starts it; past it the subtask
+# is reported as timed out and its late result dropped
+SUBTASK_TIMEOUT_SECONDS = 30
+
+# Workers per depth's subtask pool, shared by all requests; defaults to the API's
+# request threadpool size so it never caps concurrency below ROMA_THREADPOOL
+SUBTASK_WORKERS = int(os.getenv("ROMA_SUBTASK_WORKERS", os.getenv("ROMA_THREADPOOL", "128")))
+
+# Description keywords for tasks without a known kind, in priority order
+_DESCRIPTION_ROUTES = (
+    ("ingest", "ingest"), ("validat", "ingest"), ("normalize", "ingest"),
+    ("metric", "metrics"), ("calculat", "metrics"), ("score", "metrics"), ("analysis", "metrics"),
+    ("coach", "coach"), ("recommend", "coach"), ("advice", "coach"),
+    ("report", "report"), ("summary", "report"), ("generate", "report"),
+)
+
+class _TaskMemo:
+    """Bounded LRU memo keyed on a task's canonical JSON, with hit/miss counters"""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(task: Dict[str, Any]) -> bytes:
+        canonical = orjson.dumps(task, default=str, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+    
+    def get_or_compute(self, task: Dict[str, Any], compute: Callable[[Dict[str, Any]], Tuple[Any, bool]]) -> Any:
+        """compute returns (value, cacheable); failure fallbacks come back uncached"""
+        key = self._key(task)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        
+        value, cacheable = compute(task)
+        if not cacheable:
+            return value
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "size": len(self._entries)
+        }
+
+class _SubtaskRun:
+    """Deadline and abandonment flag shared between the scheduler and one subtask's worker"""
+    
+    __slots__ = ("deadline", "abandoned")
+    
+    def __init__(self):
+        self.deadline: Optional[float] = None
+        self.abandoned = False
+
 class ROMARunner:
     """
     Real Sentient ROMA Implementation with Safety Limits
@@ -20,7 +100,7 @@ class ROMARunner:
     """
     
     def __init__(self, max_depth: int = 3):
-        print("🤖 Initializing REAL Sentient ROMA Engine...")
+        log.info("🤖 Initializing REAL Sentient ROMA Engine...")
         
         # ROMA Core Components
         self.atomizer = HealthAtomizer()
@@ -30,21 +110,67 @@ class ROMARunner:
         # SAFETY: Maximum recursion depth
         self.max_depth = max_depth
         
-        # Specialized Health Executors
+        # Specialized Health Executors, one instance each; class names alias the kinds
+        ingest = DataIngestionAgent()
+        metrics = MetricsAnalysisAgent()
+        ingest_metrics = IngestMetricsAgent()
+        coach = CoachingAgent()
+        report = ReportingAgent()
+        fused = FusedAnalysisAgent()
         self.executors = {
-            "ingest": DataIngestionAgent(),
-            "metrics": MetricsAnalysisAgent(),
-            "coach": CoachingAgent(),
-            "report": ReportingAgent(),
+            "ingest": ingest,
+            "metrics": metrics,
+            "ingest_metrics": ingest_metrics,
+            "coach": coach,
+            "report": report,
+            "fused": fused,
             # Map alternative names
-            "DataIngestionAgent": DataIngestionAgent(),
-            "MetricsAnalysisAgent": MetricsAnalysisAgent(),
-            "CoachingAgent": CoachingAgent(),
-            "ReportingAgent": ReportingAgent()
+            "DataIngestionAgent": ingest,
+            "MetricsAnalysisAgent": metrics,
+            "IngestMetricsAgent": ingest_metrics,
+            "CoachingAgent": coach,
+            "ReportingAgent": report,
+            "FusedAnalysisAgent": fused
+        }
+        
+        # Prebound run methods: one dict lookup per dispatch
+        self._run_fns = {name: executor.run for name, executor in self.executors.items()}
+        
+        # Fixed part of get_system_info(); only the memo stats change between calls
+        self._static_info = {
+            "framework": "Sentient ROMA with Safety Limits",
+            "version": "1.0.0-safe",
+            "max_depth": self.max_depth,
+            "safety_features": [
+                "Recursion depth limits",
+                "Subtask count limits", 
+                "Timeout protection",
+                "Error fallbacks",
+                "Smart atomizer decisions"
+            ]
         }
         
-        print("✅ REAL ROMA agents initialized successfully")
-        print(f"🛡️  Safety: Maximum recursion depth = {max_depth}")
+        # Atomizer/planner decisions depend only on the task, so repeat tasks skip the LLM
+        self._atomizer_memo = _TaskMemo()
+        self._planner_memo = _TaskMemo()
+        
+        # Worker threads for running independent subtasks concurrently, one pool per
+        # depth: a parent blocked on its children holds a worker of its own level,
+        # never one its children need, so deep fan-out can't starve itself
+        self._pools: Dict[int, ThreadPoolExecutor] = {}
+        self._pools_lock = threading.Lock()
+        
+        log.info("✅ REAL ROMA agents initialized successfully")
+        log.info("🛡️  Safety: Maximum recursion depth = %s", max_depth)
+    
+    def _pool_for(self, depth: int) -> ThreadPoolExecutor:
+        with self._pools_lock:
+            pool = self._pools.get(depth)
+            if pool is None:
+                pool = self._pools[depth] = ThreadPoolExecutor(
+                    max_workers=SUBTASK_WORKERS, thread_name_prefix=f"roma-subtask-d{depth}"
+                )
+            return pool
     
     def _solve(self, task: Dict[str, Any], depth: int = 0) -> Dict[str, Any]:
         """
@@ -53,56 +179,71 @@ class ROMARunner:
         This maintains true ROMA recursion but prevents infinite loops
         """
         indent = "  " * depth
-        print(f"{indent}🔄 ROMA Solve (depth={depth}): {task.get('description', str(task)[:50])}...")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s🔄 ROMA Solve (depth=%s): %s...", indent, depth, task.get('description', str(task)[:50]))
         
         # SAFETY CHECK: Prevent infinite recursion
         if depth >= self.max_depth:
-            print(f"{indent}🛡️  SAFETY LIMIT: Max depth ({self.max_depth}) reached, executing atomically")
+            log.debug("%s🛡️  SAFETY LIMIT: Max depth (%s) reached, executing atomically", indent, self.max_depth)
             return self._execute(task, depth)
         
         # STEP 1: Atomizer - Check if task is atomic
-        print(f"{indent}📋 Step 1: Atomizer analyzing task...")
+        log.debug("%s📋 Step 1: Atomizer analyzing task...", indent)
         
         try:
             # Enhanced atomizer check with depth awareness
             is_atomic = self._smart_atomizer_check(task, depth)
         except Exception as e:
-            print(f"{indent}⚠️  Atomizer failed: {str(e)}, defaulting to atomic")
+            log.warning("%s⚠️  Atomizer failed: %s, defaulting to atomic", indent, e)
             is_atomic = True
         
         if is_atomic:
             # STEP 2a: Direct execution for atomic tasks
-            print(f"{indent}⚡ Task is ATOMIC - executing directly")
+            log.debug("%s⚡ Task is ATOMIC - executing directly", indent)
             return self._execute(task, depth)
         else:
             # STEP 2b: Complex task - decompose and recurse
-            print(f"{indent}🗺️  Task is COMPLEX - planning decomposition")
+            log.debug("%s🗺️  Task is COMPLEX - planning decomposition", indent)
             
             try:
                 # Plan the task into subtasks
-                subtasks = self.planner.plan(task)
-                print(f"{indent}📝 Planner created {len(subtasks)} subtasks")
+                subtasks = self._planner_memo.get_or_compute(task, self.planner.decide)
+                log.debug("%s📝 Planner created %s subtasks", indent, len(subtasks))
                 
                 # Safety: Limit number of subtasks
                 if not subtasks or len(subtasks) > 6:
-                    print(f"{indent}⚠️  Invalid subtask count ({len(subtasks)}), executing atomically")
+                    log.warning("%s⚠️  Invalid subtask count (%s), executing atomically", indent, len(subtasks))
                     return self._execute(task, depth)
                 
                 # STEP 3: Execute subtasks recursively with dependency management
-                print(f"{indent}🔗 Executing subtasks with dependencies...")
+                log.debug("%s🔗 Executing subtasks with dependencies...", indent)
                 results = self._execute_subtasks_safely(subtasks, task, depth + 1)
                 
                 # STEP 4: Aggregate results
-                print(f"{indent}🔄 Aggregating {len(results)} subtask results...")
+                log.debug("%s🔄 Aggregating %s subtask results...", indent, len(results))
                 final_result = self.aggregator.combine(results, task)
                 
-                print(f"{indent}✅ ROMA recursion completed at depth {depth}")
+                log.debug("%s✅ ROMA recursion completed at depth %s", indent, depth)
                 return final_result
                 
             except Exception as e:
-                print(f"{indent}❌ Planning/execution failed: {str(e)}, falling back to atomic")
+                log.warning("%s❌ Planning/execution failed: %s, falling back to atomic", indent, e)
                 return self._execute(task, depth)
     
+    def _run_static(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the fixed comprehensive plan straight through
+        
+        Its decomposition never varies, so the atomizer, planner and dependency walk
+        are skipped: prepared subtasks go directly to the prebound agents, then the aggregator
+        """
+        subtasks = [self._prepare_subtask_data(subtask, task, {}) for subtask in standard_plan(task.get("data", {}))]
+        if len(subtasks) == 1:
+            results = [self._execute(subtasks[0], 1)]
+        else:
+            results = list(self._pool_for(1).map(self._execute, subtasks, [1] * len(subtasks)))
+        return self.aggregator.combine(results, task)
+    
     def _smart_atomizer_check(self, task: Dict[str, Any], depth: int) -> bool:
         """
         Smart atomizer that considers depth and task complexity
@@ -111,28 +252,28 @@ class ROMARunner:
         """
         # Force atomic execution for deeper recursion levels
         if depth >= 2:
-            print(f"  🛡️  Depth {depth}: Forcing atomic for safety")
+            log.debug("  🛡️  Depth %s: Forcing atomic for safety", depth)
             return True
         
         # Check for specific atomic task types
         task_kind = task.get("kind", "")
-        if task_kind in ["ingest", "metrics", "coach", "report"]:
-            print(f"  ⚡ Known atomic task '{task_kind}'")
+        if task_kind in ["ingest", "metrics", "ingest_metrics", "coach", "report", "fused"]:
+            log.debug("  ⚡ Known atomic task '%s'", task_kind)
             return True
         
         # Check task description for atomic patterns
         desc = task.get("description", "").lower()
         atomic_patterns = ["single", "quick", "simple", "basic", "direct"]
         if any(pattern in desc for pattern in atomic_patterns):
-            print(f"  ⚡ Atomic pattern detected in description")
+            log.debug("  ⚡ Atomic pattern detected in description")
             return True
         
         # Use AI atomizer for top-level tasks only
         if depth == 0:
             try:
-                return self.atomizer.is_atomic(task)
+                return self._atomizer_memo.get_or_compute(task, self.atomizer.decide)
             except Exception as e:
-                print(f"  ⚠️  AI Atomizer failed: {str(e)}, defaulting to atomic")
+                log.warning("  ⚠️  AI Atomizer failed: %s, defaulting to atomic", e)
                 return True
         
         # Default to atomic for safety
@@ -141,89 +282,117 @@ class ROMARunner:
     def _execute_subtasks_safely(self, subtasks: List[Dict], original_task: Dict, depth: int) -> List[Dict[str, Any]]:
         """
         Execute subtasks with safety limits and proper error handling
+
+        Subtasks are scheduled online: each one is submitted as soon as its own
+        dependencies finish, so independent agents overlap their LLM calls and a
+        slow branch never holds back unrelated ones. Dependencies on ids that are
+        not in the plan are ignored; a cycle raises so the caller falls back to
+        atomic execution.
         """
         indent = "  " * depth
-        print(f"{indent}🔗 Managing {len(subtasks)} subtasks safely...")
+        log.debug("%s🔗 Managing %s subtasks safely...", indent, len(subtasks))
         
         # Safety: Limit number of subtasks
         if len(subtasks) > 4:
-            print(f"{indent}🛡️  Safety: Limiting to first 4 subtasks (was {len(subtasks)})")
+            log.debug("%s🛡️  Safety: Limiting to first 4 subtasks (was %s)", indent, len(subtasks))
             subtasks = subtasks[:4]
         
-        results = []
+        # Every subtask needs an id for dependency tracking
+        subtasks = [dict(subtask, id=subtask.get("id", f"task_{i}")) for i, subtask in enumerate(subtasks)]
+        by_id = {subtask["id"]: subtask for subtask in subtasks}
+        
+        sorter = TopologicalSorter({
+            task_id: {dep for dep in subtask.get("depends_on", []) if dep in by_id}
+            for task_id, subtask in by_id.items()
+        })
+        sorter.prepare()  # raises CycleError (a ValueError) on circular plans
+        
         completed_tasks = {}
+        running: Dict[str, Tuple[_SubtaskRun, Future]] = {}
+        # Workers post here when a subtask starts or finishes, waking the loop below
+        events: "queue.SimpleQueue[None]" = queue.SimpleQueue()
+        pool = self._pool_for(depth)
         
-        for i, subtask in enumerate(subtasks):
-            if i >= 4:  # Hard limit
-                print(f"{indent}🛡️  Safety: Stopping at 4 subtasks")
-                break
-                
-            subtask_id = subtask.get("id", f"task_{i}")
-            print(f"{indent}🔄 Executing subtask {i+1}/{len(subtasks)}: {subtask_id}")
+        while sorter.is_active():
+            for subtask_id in sorter.get_ready():
+                log.debug("%s🔄 Starting subtask %s", indent, subtask_id)
+                enhanced_subtask = self._prepare_subtask_data(by_id[subtask_id], original_task, completed_tasks)
+                run = _SubtaskRun()
+                future = pool.submit(self._run_subtask, run, enhanced_subtask, depth, events)
+                future.add_done_callback(lambda _: events.put(None))
+                running[subtask_id] = (run, future)
             
+            # Sleep until something starts or finishes, or the nearest deadline passes;
+            # subtasks still queued for a worker have no deadline yet
+            deadlines = [run.deadline for run, _ in running.values() if run.deadline is not None]
             try:
-                # Prepare subtask with dependencies
-                enhanced_subtask = self._prepare_subtask_data(subtask, original_task, completed_tasks)
-                
-                # RECURSIVE CALL with timeout protection
-                subtask_result = self._solve_with_timeout(enhanced_subtask, depth)
-                
-                # Store result
-                completed_tasks[subtask_id] = subtask_result
-                results.append(subtask_result)
-                
-                status = subtask_result.get("ok", subtask_result.get("status") == "ok")
-                print(f"{indent}{'✅' if status else '⚠️'} Subtask {subtask_id} completed")
-                
-            except Exception as e:
-                print(f"{indent}❌ Subtask {subtask_id} failed: {str(e)}")
-                error_result = {
-                    "ok": False,
-                    "error": str(e),
-                    "subtask_id": subtask_id,
-                    "status": "failed"
-                }
-                completed_tasks[subtask_id] = error_result
-                results.append(error_result)
+                events.get(timeout=max(0.0, min(deadlines) - time.monotonic()) if deadlines else None)
+            except queue.Empty:
+                pass
+            
+            now = time.monotonic()
+            for subtask_id, (run, future) in list(running.items()):
+                if future.done():
+                    completed_tasks[subtask_id] = self._collect_subtask(future, subtask_id, depth)
+                elif run.deadline is not None and run.deadline <= now:
+                    # Timeout protection: stop waiting, and let the worker discard whatever it returns
+                    run.abandoned = True
+                    log.warning("%s⏰ Subtask %s timed out after %ss", indent, subtask_id, SUBTASK_TIMEOUT_SECONDS)
+                    completed_tasks[subtask_id] = {
+                        "ok": False,
+                        "error": f"timed out after {SUBTASK_TIMEOUT_SECONDS}s",
+                        "subtask_id": subtask_id,
+                        "status": "timeout"
+                    }
+                else:
+                    continue
+                del running[subtask_id]
+                sorter.done(subtask_id)
         
-        return results
+        # Keep results in planner order
+        return [completed_tasks[subtask["id"]] for subtask in subtasks]
     
-    def _solve_with_timeout(self, task: Dict[str, Any], depth: int) -> Dict[str, Any]:
+    def _run_subtask(self, run: _SubtaskRun, task: Dict[str, Any], depth: int,
+                     events: "queue.SimpleQueue[None]") -> Optional[Dict[str, Any]]:
+        """Worker side of one subtask: starts its deadline, then solves it"""
+        run.deadline = time.monotonic() + SUBTASK_TIMEOUT_SECONDS
+        events.put(None)
+        result = self._solve(task, depth)
+        if run.abandoned:
+            log.debug("Dropping late result of %s", task.get("id"))
+            return None
+        return result
+    
+    def _collect_subtask(self, future: Future, subtask_id: str, depth: int) -> Dict[str, Any]:
         """
-        Execute solve with timeout protection to prevent hanging
+        Turn a finished subtask future into its result dict
         """
-        import signal
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError("ROMA execution timed out")
-        
+        indent = "  " * depth
         try:
-            # Set 30-second timeout for subtask execution
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(30)
+            subtask_result = future.result()
             
-            result = self._solve(task, depth)
+            status = subtask_result.get("ok", subtask_result.get("status") == "ok")
+            log.debug("%s%s Subtask %s completed", indent, '✅' if status else '⚠️', subtask_id)
+            return subtask_result
             
-            # Cancel timeout
-            signal.alarm(0)
-            return result
-            
-        except TimeoutError:
-            print(f"  ⏰ Subtask timed out after 30s, executing atomically")
-            signal.alarm(0)
-            return self._execute(task, depth)
         except Exception as e:
-            signal.alarm(0)
-            raise e
+            log.warning("%s❌ Subtask %s failed: %s", indent, subtask_id, e)
+            return {
+                "ok": False,
+                "error": str(e),
+                "subtask_id": subtask_id,
+                "status": "failed"
+            }
     
     def _prepare_subtask_data(self, subtask: Dict, original_task: Dict, completed_tasks: Dict) -> Dict[str, Any]:
         """
         Prepare subtask with data from dependencies (safely)
         """
+        source_data = subtask.get("data", original_task.get("data", {}))
         enhanced_subtask = {
             "kind": subtask.get("kind", ""),
             "description": subtask.get("description", ""),
-            "data": dict(subtask.get("data", original_task.get("data", {}))),
+            "data": dict(source_data),
             "subtask_id": subtask.get("id", "")
         }
         
@@ -235,6 +404,11 @@ class ROMARunner:
                 if dep_result.get("normalized_data"):
                     enhanced_subtask["data"]["dependency_data"] = dep_result["normalized_data"]
         
+        # Subtasks working on the untouched root data reuse its serialized prompt JSON
+        if "_data_json" in original_task and source_data is original_task.get("data") \
+                and "dependency_data" not in enhanced_subtask["data"]:
+            enhanced_subtask["_data_json"] = original_task["_data_json"]
+        
         return enhanced_subtask
     
     def _execute(self, task: Dict[str, Any], depth: int = 0) -> Dict[str, Any]:
@@ -245,27 +419,22 @@ class ROMARunner:
         task_kind = task.get("kind", "")
         
         # Smart executor mapping
-        if task_kind in self.executors:
+        run_fn = self._run_fns.get(task_kind)
+        if run_fn is not None:
             executor_name = task_kind
         else:
             # Map by description
             desc = task.get("description", "").lower()
-            if any(word in desc for word in ["ingest", "validat", "normalize"]):
-                executor_name = "ingest"
-            elif any(word in desc for word in ["metric", "calculat", "score", "analysis"]):
-                executor_name = "metrics"  
-            elif any(word in desc for word in ["coach", "recommend", "advice"]):
-                executor_name = "coach"
-            elif any(word in desc for word in ["report", "summary", "generate"]):
-                executor_name = "report"
-            else:
-                executor_name = "ingest"  # Safe default
-        
-        print(f"{indent}⚙️ Executing with {executor_name} agent...")
+            executor_name = next(
+                (name for word, name in _DESCRIPTION_ROUTES if word in desc),
+                "ingest"  # Safe default
+            )
+            run_fn = self._run_fns[executor_name]
+        
+        log.debug("%s⚙️ Executing with %s agent...", indent, executor_name)
         
         try:
-            executor = self.executors[executor_name]
-            result = executor.run(task)
+            result = run_fn(task)
             
             # Ensure result structure
             if isinstance(result, dict):
@@ -273,12 +442,12 @@ class ROMARunner:
                 result["depth"] = depth
             
             status = result.get("ok", result.get("status") == "ok")
-            print(f"{indent}{'✅' if status else '⚠️'} {executor_name} completed")
+            log.debug("%s%s %s completed", indent, '✅' if status else '⚠️', executor_name)
             
             return result
             
         except Exception as e:
-            print(f"{indent}❌ Execution failed: {str(e)}")
+            log.warning("%s❌ Execution failed: %s", indent, e)
             return {
                 "ok": False,
                 "error": str(e),
@@ -291,21 +460,22 @@ class ROMARunner:
         """
         Main entry point for comprehensive health analysis
         """
-        print("🚀 Starting ROMA weekly health analysis...")
+        log.info("🚀 Starting ROMA weekly health analysis...")
         start_time = time.time()
         
         root_task = {
             "kind": "comprehensive_health_analysis",
             "description": "Comprehensive weekly health analysis with personalized insights",
             "data": data,
-            "complexity": "high"
+            "complexity": "high",
+            "_data_json": _prompt_json(data)
         }
         
         try:
-            result = self._solve(root_task)
+            result = self._run_static(root_task)
             
             execution_time = time.time() - start_time
-            print(f"✅ ROMA analysis completed in {execution_time:.2f}s")
+            log.info("✅ ROMA analysis completed in %.2fs", execution_time)
             
             # Add metadata
             if isinstance(result, dict):
@@ -320,7 +490,7 @@ class ROMARunner:
             
         except Exception as e:
             execution_time = time.time() - start_time
-            print(f"❌ ROMA analysis failed after {execution_time:.2f}s: {str(e)}")
+            log.error("❌ ROMA analysis failed after %.2fs: %s", execution_time, e)
             return {
                 "ok": False,
                 "error": f"ROMA execution failed: {str(e)}",
@@ -347,17 +517,24 @@ class ROMARunner:
         }
         return self._solve(task)
     
+    # Async entry points for callers on an event loop. The pipeline stays on worker
+    # threads (its independent subtasks already fan out concurrently on the subtask pools),
+    # so awaiting these keeps the loop free while the LLM round-trips are in flight.
+    async def arun_weekly(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.run_weekly, data)
+    
+    async def aanalyze_single(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.analyze_single, entry)
+    
+    async def achat(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.chat, message)
+    
     def get_system_info(self) -> Dict[str, Any]:
         """Get ROMA system information"""
         return {
-            "framework": "Sentient ROMA with Safety Limits",
-            "version": "1.0.0-safe",
-            "max_depth": self.max_depth,
-            "safety_features": [
-                "Recursion depth limits",
-                "Subtask count limits", 
-                "Timeout protection",
-                "Error fallbacks",
-                "Smart atomizer decisions"
-            ]
+            **self._static_info,
+            "memo": {
+                "atomizer": self._atomizer_memo.stats(),
+                "planner": self._planner_memo.stats()
+            }
         }
@@ -1,36 +1,46 @@
-from flask import Flask, jsonify, request
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from typing import Any, Dict
 
-app = Flask(__name__)
+app = FastAPI(title="ROMA Simple Service")
+
+async def _json_body(request: Request) -> Dict[str, Any]:
+    try:
+        payload = await request.json()
+    except Exception:
+        return {}
+    return payload or {}
 
 @app.get("/api/simple/status")
-def status():
-    return jsonify({
+async def status():
+    return {
         "ok": True,
         "service": "roma",
         "endpoints": ["/api/simple/status", "/api/simple/execute", "/api/simple/research", "/api/simple/analysis"]
-    })
+    }
 
 @app.post("/api/simple/execute")
-def simple_execute():
-    payload = request.get_json(silent=True) or {}
+async def simple_execute(request: Request):
+    payload = await _json_body(request)
     goal = payload.get("goal") or ""
     # trivial behavior to prove the pipe works
     if goal.strip().lower() == "reply with exactly the word ok.":
-        return jsonify({"final_output": "OK", "status": "completed"})
-    return jsonify({"final_output": f"Echo: {goal}", "status": "completed"})
+        return {"final_output": "OK", "status": "completed"}
+    return {"final_output": f"Echo: {goal}", "status": "completed"}
 
 @app.post("/api/simple/research")
-def simple_research():
-    payload = request.get_json(silent=True) or {}
-    return jsonify({"status": "ok", "topic": payload.get("topic")})
+async def simple_research(request: Request):
+    payload = await _json_body(request)
+    return {"status": "ok", "topic": payload.get("topic")}
 
 @app.post("/api/simple/analysis")
-def simple_analysis():
-    payload = request.get_json(silent=True) or {}
+async def simple_analysis(request: Request):
+    payload = await _json_body(request)
     if "data_description" not in payload:
-        return jsonify({"error":"Missing required fields: data_description"}), 400
-    return jsonify({"status":"ok","summary":"placeholder"})
+        return JSONResponse({"error":"Missing required fields: data_description"}, status_code=400)
+    return {"status":"ok","summary":"placeholder"}
 
 if __name__ == "__main__":
+    import uvicorn
     # Run on port 3001 to avoid conflict with main app on port 5000
-    app.run(host="localhost", port=3001)
+    uvicorn.run(app, host="localhost", port=3001, loop="uvloop", http="httptools")
@@ -4,12 +4,22 @@ Properly organized with correct imports and initialization order
 """
 
 # Core imports
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Any, Dict, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, List, Optional, Union
 import os
+import re
 import time
+import hashlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from anyio import to_thread
+from cachetools import TTLCache
 
 # Setup logging first
 from logging_config import setup_logging, get_logger
@@ -25,7 +35,15 @@ try:
 except Exception as e:
     roma_runner = None
     roma_status = "failed"
-    logger.error(f"❌ ROMA engine failed to load: {e}")
+    logger.error("❌ ROMA engine failed to load: %s", e)
+
+# Report storage (written by the ROMA agents, read back through /reports)
+try:
+    from storage.db import HealthDatabase
+    report_db = HealthDatabase()
+except Exception as e:
+    report_db = None
+    logger.warning("⚠️  Report storage not available: %s", e)
 
 # Import simple API endpoints
 try:
@@ -34,13 +52,15 @@ try:
     logger.info("✅ Simple API endpoints available")
 except ImportError as e:
     SIMPLE_API_AVAILABLE = False
-    logger.warning(f"⚠️  Simple API endpoints not available: {e}")
+    logger.warning("⚠️  Simple API endpoints not available: %s", e)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Sentient ROMA Health Tracker",
     version="1.0.0",
-    description="Advanced health analysis using Sentient AGI ROMA framework with LLM fallback support"
+    description="Advanced health analysis using Sentient AGI ROMA framework with LLM fallback support",
+    # orjson encodes the large ROMA result dicts several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -52,14 +72,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress report-sized JSON bodies (LLM prose shrinks ~70%); small replies go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include simple API router if available
 if SIMPLE_API_AVAILABLE:
     app.include_router(simple_router)
     logger.info("✅ Simple API endpoints included")
 
+# Optional API key guarding the saved reports (same X-API-Key scheme as main.py)
+API_KEY = os.getenv("API_KEY", "demo-key-12345")
+
+def require_api_key(x_api_key: str = Header(default=None, alias="X-API-Key")):
+    if API_KEY and x_api_key != API_KEY:
+        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+    return True
+
 # Pydantic models
+class WeeklyMetrics(BaseModel):
+    """Weekly totals: the known fields are type-checked, anything else passes through"""
+    model_config = ConfigDict(extra="allow")
+    
+    # int | float: smart-mode union keeps the client's 72000 an int and still takes 8500.5
+    steps: Optional[Union[int, float]] = None
+    sleep_hours: Optional[float] = None
+    workouts: Optional[Union[int, float]] = None
+    water_liters: Optional[float] = None
+
 class WeeklyData(BaseModel):
-    data: Dict[str, Any]
+    data: WeeklyMetrics
 
 class HealthEntry(BaseModel):
     steps: Optional[int] = None
@@ -73,24 +114,28 @@ class ChatMessage(BaseModel):
     context: Optional[str] = None
 
 # Main API endpoints
+# Fixed once the module has loaded (roma/simple status included), so it is
+# serialized a single time and each request just sends the bytes
+_ROOT_BYTES = orjson.dumps({
+    "service": "Sentient ROMA Health Tracker",
+    "version": "1.0.0",
+    "status": "🤖 Multi-agent health analysis system",
+    "roma_status": roma_status,
+    "simple_api": SIMPLE_API_AVAILABLE,
+    "endpoints": {
+        "main": ["/", "/health", "/weekly-report", "/analyze", "/chat", "/chat/stream", "/roma-info", "/reports"],
+        "simple": ["/api/simple/execute", "/api/simple/analysis", "/api/simple/research"] if SIMPLE_API_AVAILABLE else [],
+        "docs": "/docs"
+    }
+})
+
 @app.get("/")
-def root():
+async def root():
     """System information and status"""
-    return {
-        "service": "Sentient ROMA Health Tracker",
-        "version": "1.0.0",
-        "status": "🤖 Multi-agent health analysis system",
-        "roma_status": roma_status,
-        "simple_api": SIMPLE_API_AVAILABLE,
-        "endpoints": {
-            "main": ["/", "/health", "/weekly-report", "/analyze", "/chat", "/roma-info"],
-            "simple": ["/api/simple/execute", "/api/simple/analysis", "/api/simple/research"] if SIMPLE_API_AVAILABLE else [],
-            "docs": "/docs"
-        }
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
-def health():
+async def health():
     """System health check"""
     return {
         "status": "healthy" if roma_status == "active" else "degraded",
@@ -100,7 +145,7 @@ def health():
     }
 
 @app.get("/roma-info")
-def roma_info():
+async def roma_info():
     """ROMA system architecture information"""
     if roma_runner is None:
         raise HTTPException(status_code=503, detail="ROMA engine not available")
@@ -121,7 +166,7 @@ async def weekly_report(payload: WeeklyData):
     
     try:
         start_time = time.time()
-        result = roma_runner.run_weekly(payload.data)
+        result = await roma_runner.arun_weekly(payload.data.model_dump(exclude_unset=True))
         execution_time = time.time() - start_time
         
         # Add execution metadata
@@ -132,11 +177,11 @@ async def weekly_report(payload: WeeklyData):
                 "roma_pattern": "hierarchical_decomposition"
             }
         
-        logger.info(f"Weekly report completed in {execution_time:.2f}s")
+        logger.info("Weekly report completed in %.2fs", execution_time)
         return {"report": result}
         
     except Exception as e:
-        logger.error(f"Weekly report failed: {e}")
+        logger.error("Weekly report failed: %s", e)
         raise HTTPException(status_code=500, detail=f"ROMA analysis failed: {str(e)}")
 
 @app.post("/analyze")
@@ -155,7 +200,7 @@ async def analyze(entry: HealthEntry):
         # Convert HealthEntry to dict
         entry_data = entry.dict(exclude_none=True)
         
-        result = roma_runner.analyze_single(entry_data)
+        result = await roma_runner.aanalyze_single(entry_data)
         
         return {
             "analysis": result,
@@ -163,9 +208,26 @@ async def analyze(entry: HealthEntry):
         }
         
     except Exception as e:
-        logger.error(f"Single entry analysis failed: {e}")
+        logger.error("Single entry analysis failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+@app.post("/analyze-batch")
+async def analyze_batch(entries: List[HealthEntry]):
+    """
+    Health scores for many entries at once
+    
+    Pure arithmetic, no LLM: every entry is scored in one vectorized numpy pass
+    """
+    from roma_agents.sentient_health_agents import metrics_scores_batch
+    
+    rows = [entry.dict(exclude_none=True) for entry in entries]
+    scores = metrics_scores_batch(rows).round(1).tolist()
+    return {
+        "count": len(scores),
+        "health_scores": scores,
+        "roma_pattern": "vectorized_batch_scoring"
+    }
+
 @app.post("/chat")
 async def chat(message: ChatMessage):
     """
@@ -176,7 +238,7 @@ async def chat(message: ChatMessage):
     if roma_runner is None:
         raise HTTPException(status_code=503, detail="ROMA engine not available")
     
-    logger.info(f"Processing health coach chat: {message.message[:50]}...")
+    logger.info("Processing health coach chat: %.50s...", message.message)
     
     try:
         chat_data = {
@@ -184,7 +246,7 @@ async def chat(message: ChatMessage):
             "context": message.context or ""
         }
         
-        result = roma_runner.chat(chat_data)
+        result = await roma_runner.achat(chat_data)
         
         return {
             "chat_response": result,
@@ -192,9 +254,34 @@ async def chat(message: ChatMessage):
         }
         
     except Exception as e:
-        logger.error(f"Health chat failed: {e}")
+        logger.error("Health chat failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
+@app.post("/chat/stream")
+async def chat_stream(message: ChatMessage):
+    """
+    Chat with AI health coach, streamed
+    
+    Server-sent events: one `data: {"delta": ...}` event per text chunk as the
+    LLM generates it, then `data: [DONE]`
+    """
+    if roma_runner is None:
+        raise HTTPException(status_code=503, detail="ROMA engine not available")
+    
+    logger.info("Streaming health coach chat: %.50s...", message.message)
+    
+    chunks = roma_runner.executors["coach"].stream({
+        "data": {"message": message.message, "context": message.context or ""}
+    })
+    
+    # Sync generator: Starlette drains it on its threadpool, off the event loop
+    def events():
+        for piece in chunks:
+            yield b"data: " + orjson.dumps({"delta": piece}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.post("/normalize")
 async def normalize(payload: WeeklyData):
     """
@@ -208,11 +295,10 @@ async def normalize(payload: WeeklyData):
     logger.info("Processing data normalization")
     
     try:
-        # Use ROMA's data ingestion agent for normalization
-        from roma_agents.sentient_health_agents import DataIngestionAgent
-        
-        ingestion_agent = DataIngestionAgent()
-        result = ingestion_agent.run({"data": payload.data})
+        # Use ROMA's data ingestion agent for normalization; it blocks on the LLM,
+        # so it runs on the threadpool rather than the event loop
+        ingestion_agent = roma_runner.executors["ingest"]
+        result = await run_in_threadpool(ingestion_agent.run, {"data": payload.data.model_dump(exclude_unset=True)})
         
         return {
             "normalized_data": result.get("normalized_data", {}),
@@ -222,22 +308,26 @@ async def normalize(payload: WeeklyData):
         }
         
     except Exception as e:
-        logger.error(f"Data normalization failed: {e}")
+        logger.error("Data normalization failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Normalization failed: {str(e)}")
 
+# Static, so built and serialized once rather than per request
+EXAMPLE_PAYLOAD = {
+    "steps": 72000,
+    "sleep_hours": 49,
+    "workouts": 4,
+    "water_liters": 14,
+    "description": "Weekly health data example"
+}
+_EXAMPLE_BYTES = orjson.dumps(EXAMPLE_PAYLOAD)
+
 @app.get("/example")
-def example():
+async def example():
     """Example payload for testing"""
-    return {
-        "steps": 72000,
-        "sleep_hours": 49,
-        "workouts": 4,
-        "water_liters": 14,
-        "description": "Weekly health data example"
-    }
+    return Response(_EXAMPLE_BYTES, media_type="application/json")
 
 @app.get("/api/status")
-def api_status():
+async def api_status():
     """Complete API status including all subsystems"""
     return {
         "main_api": "active",
@@ -252,7 +342,8 @@ def api_status():
         "endpoints": {
             "main": [
                 "/", "/health", "/weekly-report", "/analyze", 
-                "/chat", "/roma-info", "/normalize", "/example"
+                "/analyze-batch", "/chat", "/chat/stream", "/roma-info", "/normalize", "/example",
+                "/reports", "/reports/{report_id}"
             ],
             "simple": [
                 "/api/simple/execute", "/api/simple/analysis", 
@@ -266,6 +357,59 @@ def api_status():
         }
     }
 
+# Dashboards poll the listing; a one-second cache collapses each burst of
+# identical queries into one SQLite scan (the lock keeps a cold burst to one too)
+_REPORTS_LIST_CACHE: TTLCache = TTLCache(maxsize=16, ttl=1.0)
+_REPORTS_LIST_LOCK = asyncio.Lock()
+
+@app.get("/reports", dependencies=[Depends(require_api_key)] if API_KEY else None)
+async def reports_list(limit: int = Query(20, ge=1, le=100)):
+    """Most recent saved reports (ids and timestamps)"""
+    if report_db is None:
+        raise HTTPException(status_code=503, detail="Report storage not available")
+    reports = _REPORTS_LIST_CACHE.get(limit)
+    if reports is None:
+        async with _REPORTS_LIST_LOCK:
+            reports = _REPORTS_LIST_CACHE.get(limit)
+            if reports is None:
+                reports = await report_db.list_reports(limit)
+                _REPORTS_LIST_CACHE[limit] = reports
+    return ORJSONResponse({"reports": reports}, headers={"Cache-Control": "private, max-age=1"})
+
+_ETAG_LIST_ITEM = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check per RFC 9110 §13.1.2: `*` or any listed tag, compared weakly"""
+    for tag in _ETAG_LIST_ITEM.findall(if_none_match):
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+@app.get("/reports/{report_id}", dependencies=[Depends(require_api_key)] if API_KEY else None)
+async def reports_get(report_id: int, if_none_match: Optional[str] = Header(default=None)):
+    """
+    A saved report by id
+    
+    Reports are insert-only, so (id, created_at) is a stable ETag: a client
+    revalidating a report it already has gets a 304 after an index-only
+    lookup, without reading or serializing the payload
+    """
+    if report_db is None:
+        raise HTTPException(status_code=503, detail="Report storage not available")
+    created_at = await report_db.report_created_at(report_id)
+    if created_at is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    etag = '"%s"' % hashlib.blake2b(f"{report_id}:{created_at}".encode(), digest_size=12).hexdigest()
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    report = await report_db.get_report(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return ORJSONResponse(
+        {"id": report_id, **report},
+        headers={"ETag": etag, "Cache-Control": "private, max-age=31536000, immutable"}
+    )
+
 @app.get("/test-roma")
 async def test_roma():
     """Test ROMA system functionality"""
@@ -283,7 +427,7 @@ async def test_roma():
     
     try:
         start_time = time.time()
-        result = roma_runner.run_weekly(test_data)
+        result = await roma_runner.arun_weekly(test_data)
         test_time = time.time() - start_time
         
         return {
@@ -296,7 +440,7 @@ async def test_roma():
         }
         
     except Exception as e:
-        logger.error(f"ROMA test failed: {e}")
+        logger.error("ROMA test failed: %s", e)
         return {
             "test_status": "❌ FAILED",
             "error": str(e),
@@ -308,8 +452,24 @@ async def test_roma():
 async def startup_event():
     """Application startup"""
     logger.info("🚀 Sentient ROMA Health Tracker starting up...")
-    logger.info(f"📊 ROMA Status: {roma_status}")
-    logger.info(f"🔧 Simple API: {'Available' if SIMPLE_API_AVAILABLE else 'Unavailable'}")
+    logger.info("📊 ROMA Status: %s", roma_status)
+    logger.info("🔧 Simple API: %s", 'Available' if SIMPLE_API_AVAILABLE else 'Unavailable')
+    
+    # Each in-flight ROMA request holds a worker thread for its whole LLM round-trip;
+    # size both pools it can land on (runner's asyncio.to_thread, Starlette's
+    # run_in_threadpool) so concurrency isn't silently capped at their defaults
+    threadpool_size = int(os.getenv("ROMA_THREADPOOL", "128"))
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=threadpool_size, thread_name_prefix="roma-request")
+    )
+    to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+    
+    # Open the report DB (pragmas + schema) once, not on the first request
+    if report_db is not None:
+        try:
+            await report_db.init()
+        except Exception as e:
+            logger.warning("⚠️  Report storage init failed: %s", e)
     
     if roma_status == "active":
         logger.info("✅ All systems ready for health analysis!")
@@ -321,6 +481,8 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown"""
     logger.info("🔄 Shutting down Sentient ROMA Health Tracker...")
+    if report_db is not None:
+        await report_db.close()
 
 # Main execution
 if __name__ == "__main__":
@@ -334,9 +496,15 @@ if __name__ == "__main__":
     print(f"🧪 Test Endpoint: http://127.0.0.1:8000/test-roma")
     print("=" * 60)
     
+    # Worker processes on uvloop/httptools. Auto-reload (ENV=dev, or RELOAD=1)
+    # watches files from a single process, so it runs one worker
+    reload = os.getenv("RELOAD", "1" if os.getenv("ENV", "prod") == "dev" else "0") == "1"
     uvicorn.run(
-        app,
+        "sentient_roma_api:app",
         host=os.getenv("HOST", "127.0.0.1"),
         port=int(os.getenv("PORT", "8000")),
-        reload=True
+        workers=1 if reload else int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+        loop="uvloop",
+        http="httptools",
+        reload=reload
     )
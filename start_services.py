@@ -2,29 +2,79 @@
 """
 Startup script to run both the ROMA service and main FastAPI application
 """
-import subprocess
+import asyncio
+import signal
 import sys
-import time
-import threading
 import os
+from typing import List, Optional
 
-def run_roma_service():
-    """Run the ROMA service in the background"""
-    print("Starting ROMA service on port 3001...")
-    subprocess.run([sys.executable, "roma_service.py"], check=False)
+# roma_service.py binds localhost:3001
+ROMA_HOST = "127.0.0.1"
+ROMA_PORT = 3001
+ROMA_READY_TIMEOUT = float(os.getenv("ROMA_READY_TIMEOUT", "30"))
 
-def run_main_app():
-    """Run the main FastAPI application"""
-    print("Starting main FastAPI application on port 8000...")
-    subprocess.run([sys.executable, "main.py"], check=False)
+async def wait_port(host: str, port: int, timeout: float,
+                    proc: Optional[asyncio.subprocess.Process] = None) -> bool:
+    """Poll until host:port accepts connections; False on timeout or if proc exits first"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except OSError:
+            if loop.time() >= deadline or (proc is not None and proc.returncode is not None):
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+def main_app_command() -> List[str]:
+    """The main FastAPI application: one Uvicorn worker per core under Gunicorn"""
+    host = os.getenv("HOST", "0.0.0.0")
+    port = os.getenv("PORT", "8000")
+    workers = os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))
+    # --preload imports the app once in the master; workers share it copy-on-write
+    return [
+        "gunicorn", "main:app",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", workers,
+        "--preload",
+        "-b", f"{host}:{port}",
+    ]
+
+async def main() -> int:
+    # SIGTERM/SIGINT cancel this task; the finally block then stops both children
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, task.cancel)
+
+    procs: List[asyncio.subprocess.Process] = []
+    try:
+        print(f"Starting ROMA service on port {ROMA_PORT}...")
+        roma = await asyncio.create_subprocess_exec(sys.executable, "roma_service.py")
+        procs.append(roma)
+
+        # Start the main app as soon as ROMA accepts connections, not after a fixed sleep
+        if not await wait_port(ROMA_HOST, ROMA_PORT, ROMA_READY_TIMEOUT, roma):
+            print("ROMA service not ready; starting main application without it")
+
+        command = main_app_command()
+        print(f"Starting main FastAPI application: {' '.join(command)}")
+        main_app = await asyncio.create_subprocess_exec(*command)
+        procs.append(main_app)
+        return await main_app.wait()
+    finally:
+        for proc in procs:
+            if proc.returncode is None:
+                proc.terminate()
+        await asyncio.gather(*(proc.wait() for proc in procs))
 
 if __name__ == "__main__":
-    # Start ROMA service in a separate thread
-    roma_thread = threading.Thread(target=run_roma_service, daemon=True)
-    roma_thread.start()
-    
-    # Give ROMA service a moment to start
-    time.sleep(2)
-    
-    # Start main application
-    run_main_app()
\ No newline at end of file
+    try:
+        sys.exit(asyncio.run(main()))
+    except asyncio.CancelledError:
+        sys.exit(0)
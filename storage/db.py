@@ -1,7 +1,7 @@
 import os
-import json
+import orjson
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import aiosqlite
 
 DB_PATH = os.getenv("DB_PATH", "/app/data/db.sqlite")
@@ -10,37 +10,96 @@ SCHEMA = """
 CREATE TABLE IF NOT EXISTS reports (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    payload TEXT NOT NULL
+    payload BLOB NOT NULL
 );
+-- Covers list_reports: newest-first ids and timestamps without touching payload pages
+CREATE INDEX IF NOT EXISTS idx_reports_id_created ON reports (id DESC, created_at);
 """
 
+# Applied once to the connection: WAL lets readers run alongside the writer and,
+# with synchronous=NORMAL, a commit is an append instead of two fsyncs; reads of
+# the first 256 MB are served from a memory map rather than read() calls
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Fixed statement text, so sqlite3's per-connection statement cache reuses the plan
+INSERT_REPORT = "INSERT INTO reports (payload) VALUES (?)"
+SELECT_REPORT = "SELECT payload FROM reports WHERE id = ?"
+SELECT_CREATED_AT = "SELECT created_at FROM reports WHERE id = ?"
+LIST_REPORTS = "SELECT id, created_at FROM reports ORDER BY id DESC LIMIT ?"
+
 class HealthDatabase:
+    """One long-lived aiosqlite connection per instance, opened on first use.
+
+    The connection belongs to the event loop that opened it; threads running
+    their own loop should use their own instance.
+    """
+
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or DB_PATH
         # ensure db dir exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn_lock = asyncio.Lock()
+
+    async def get_conn(self) -> aiosqlite.Connection:
+        if self._conn is None:
+            async with self._conn_lock:
+                if self._conn is None:
+                    conn = await aiosqlite.connect(self.db_path)
+                    for pragma in PRAGMAS:
+                        await conn.execute(pragma)
+                    await conn.executescript(SCHEMA)
+                    await conn.commit()
+                    self._conn = conn
+        return self._conn
 
     async def init(self) -> None:
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(SCHEMA)
-            await db.commit()
+        await self.get_conn()
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
 
     async def save_report(self, data: Dict[str, Any]) -> int:
         """Persist a report dict and return its id."""
-        await self.init()
-        async with aiosqlite.connect(self.db_path) as db:
-            cur = await db.execute(
-                "INSERT INTO reports (payload) VALUES (?)",
-                (json.dumps(data),),
-            )
-            await db.commit()
-            return cur.lastrowid
+        db = await self.get_conn()
+        cur = await db.execute(INSERT_REPORT, (orjson.dumps(data),))
+        await db.commit()
+        return cur.lastrowid
+
+    async def save_reports(self, items: List[Dict[str, Any]]) -> int:
+        """Persist several report dicts in one transaction and return how many were written."""
+        db = await self.get_conn()
+        await db.executemany(INSERT_REPORT, [(orjson.dumps(data),) for data in items])
+        await db.commit()
+        return len(items)
+
+    async def list_reports(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Newest reports first, as {id, created_at} without their payloads."""
+        db = await self.get_conn()
+        async with db.execute(LIST_REPORTS, (limit,)) as cur:
+            rows = await cur.fetchall()
+        return [{"id": row[0], "created_at": row[1]} for row in rows]
+
+    async def report_created_at(self, report_id: int) -> Optional[str]:
+        """When a report was saved, or None if it does not exist (index-only, no payload read)."""
+        db = await self.get_conn()
+        async with db.execute(SELECT_CREATED_AT, (report_id,)) as cur:
+            row = await cur.fetchone()
+        return row[0] if row else None
 
     async def get_report(self, report_id: int) -> Optional[Dict[str, Any]]:
-        await self.init()
-        async with aiosqlite.connect(self.db_path) as db:
-            cur = await db.execute("SELECT payload FROM reports WHERE id = ?", (report_id,))
+        db = await self.get_conn()
+        async with db.execute(SELECT_REPORT, (report_id,)) as cur:
             row = await cur.fetchone()
-            if not row:
-                return None
-            return json.loads(row[0])
+        if not row:
+            return None
+        # BLOB rows and TEXT rows written before the switch both parse directly
+        return orjson.loads(row[0])
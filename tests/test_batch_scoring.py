@@ -0,0 +1,90 @@
+# tests/test_batch_scoring.py
+import itertools
+import math
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+# main.py creates its SQLite tables at import; keep them out of the repo's data/
+os.environ.setdefault("DB_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "health.db"))
+
+import main
+from roma_agents.sentient_health_agents import _metrics_summary, metrics_scores_batch
+
+
+def _local_rows():
+    # Every band edge for each metric, plus "missing" (None)
+    values = {
+        "resting_hr": [None, 45, 50, 60, 61, 70, 71, 80, 81],
+        "hrv": [None, 40, 50, 69, 70],
+        "calories": [None, 9999, 10000],
+        "runs": [None, 0, 2, 3, 3.7],
+    }
+    for combo in itertools.product(*values.values()):
+        yield {k: v for k, v in zip(values, combo) if v is not None}
+
+
+class TestLocalBatchScoring:
+    def test_batch_matches_scalar_path_row_by_row(self):
+        rows = list(_local_rows())
+        cols = {k: [float(r[k]) if k in r else math.nan for r in rows] for k in main.LOCAL_METRICS}
+
+        batch = main.analyze_health_locally_batch(cols)
+
+        assert len(batch) == len(rows)
+        for row, result in zip(rows, batch):
+            assert result == main.analyze_health_locally(row), row
+
+    def test_numpy_fallback_matches_score_kernel(self):
+        if not main.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed; only the NumPy scorer is in use")
+        rows = list(_local_rows())
+        rhr, hrv, _, runs = (np.array([r.get(k, np.nan) for r in rows], dtype=float) for k in main.LOCAL_METRICS)
+        runs = np.trunc(runs)
+        flag_count = np.arange(len(rows), dtype=np.int64) % 4
+        runs_i = np.where(np.isnan(runs), -1, runs).astype(np.int64)
+
+        np.testing.assert_array_equal(
+            main._score_numpy(rhr, hrv, runs, flag_count),
+            main._score_kernel(rhr, hrv, runs_i, flag_count),
+        )
+
+    def test_known_scores(self):
+        ideal = main.analyze_health_locally({"resting_hr": 55, "hrv": 80, "calories": 12000, "runs": 4})
+        flagged = main.analyze_health_locally({"resting_hr": 90, "hrv": 30, "calories": 5000, "runs": 0})
+        assert ideal["score"] == 85
+        assert flagged["score"] == 30
+
+
+class TestMetricsBatchScoring:
+    ROWS = [
+        {},
+        {"steps": 0, "sleep_hours": 0, "workouts": 0, "water_liters": 0},
+        {"steps": 72000, "sleep_hours": 49, "workouts": 4, "water_liters": 14},
+        {"steps": 150000, "sleep_hours": 70, "workouts": 9, "water_liters": 30},
+        {"steps": 5000, "sleep_hours": 28.5, "water_liters": 7.25},
+        {"steps": -1000, "sleep_hours": -2, "workouts": 0, "water_liters": -1},
+        {"steps": None, "sleep_hours": None, "workouts": None, "water_liters": None},
+        {"steps": 9999, "workouts": 6},
+    ]
+
+    def test_batch_matches_scalar_summary(self):
+        batch = metrics_scores_batch(self.ROWS)
+        scalar = [_metrics_summary(row)[1] for row in self.ROWS]
+        np.testing.assert_allclose(batch, scalar, rtol=0, atol=1e-9)
+
+    def test_scores_are_clipped_to_0_100(self):
+        for row in self.ROWS:
+            scores = _metrics_summary(row)[0]["scores"]
+            assert all(0.0 <= scores[k] <= 100.0 for k in ("activity", "hydration", "sleep", "overall"))
+
+    def test_known_score(self):
+        # 72k steps -> 72 + 4 workouts * 15 = 132 -> 100; 14 L -> 100; 49 h of 56 -> 87.5
+        summary, overall = _metrics_summary({"steps": 72000, "sleep_hours": 49, "workouts": 4, "water_liters": 14})
+        assert summary["scores"] == {"activity": 100.0, "hydration": 100.0, "sleep": 87.5, "overall": 95.8}
+        assert overall == pytest.approx(287.5 / 3)
+
+    def test_empty_batch(self):
+        assert metrics_scores_batch([]).shape == (0,)
@@ -0,0 +1,89 @@
+# tests/test_llm_single_flight.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import roma_agents.sentient_health_agents as agents
+
+
+class TestAskLLMSingleFlight:
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        agents._LLM_CACHE.clear()
+        agents._LLM_INFLIGHT.clear()
+        yield
+        agents._LLM_CACHE.clear()
+        agents._LLM_INFLIGHT.clear()
+
+    def test_concurrent_identical_prompts_make_one_call(self, monkeypatch):
+        calls = []
+        release = threading.Event()
+
+        def fake_call(prompt, system_prompt, stream, json_mode, model, temperature):
+            calls.append(prompt)
+            release.wait(5)
+            return "reply"
+
+        monkeypatch.setattr(agents, "_call_llm", fake_call)
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(agents._ask_llm, "same prompt", "sys") for _ in range(6)]
+            deadline = time.monotonic() + 5
+            while not agents._LLM_INFLIGHT and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            replies = [f.result(timeout=5) for f in futures]
+
+        assert replies == ["reply"] * 6
+        assert calls == ["same prompt"]
+        assert not agents._LLM_INFLIGHT
+
+    def test_successful_reply_is_cached(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(agents, "_call_llm", lambda *args: calls.append(args) or "reply")
+
+        assert agents._ask_llm("p", "s") == "reply"
+        assert agents._ask_llm("p", "s") == "reply"
+        assert len(calls) == 1
+
+    def test_error_replies_are_not_cached(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(agents, "_call_llm", lambda *args: calls.append(args) or "LLM error: boom")
+
+        agents._ask_llm("p", "s")
+        agents._ask_llm("p", "s")
+        assert len(calls) == 2
+
+    def test_cache_key_separates_call_options(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(agents, "_call_llm", lambda *args: calls.append(args) or "reply")
+
+        agents._ask_llm("p", "s")
+        agents._ask_llm("p", "s", json_mode=True)
+        agents._ask_llm("p", "s", temperature=0.0)
+        agents._ask_llm("p", "s", model="small")
+        assert len(calls) == 4
+
+    def test_leader_exception_releases_waiters(self, monkeypatch):
+        release = threading.Event()
+
+        def fake_call(*args):
+            release.wait(5)
+            raise RuntimeError("provider down")
+
+        monkeypatch.setattr(agents, "_call_llm", fake_call)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(agents._ask_llm, "p", "s")
+            deadline = time.monotonic() + 5
+            while not agents._LLM_INFLIGHT and time.monotonic() < deadline:
+                time.sleep(0.01)
+            waiter = pool.submit(agents._ask_llm, "p", "s")
+            time.sleep(0.05)
+            release.set()
+
+            with pytest.raises(RuntimeError):
+                leader.result(timeout=5)
+            assert waiter.result(timeout=5).startswith("LLM error")
+        assert not agents._LLM_INFLIGHT
@@ -0,0 +1,74 @@
+# tests/test_rate_limiter.py
+import threading
+import types
+
+import pytest
+
+import llm_fallback
+from llm_fallback import _RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only moves when sleep() is called"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(llm_fallback, "time", types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+        return clock
+
+    def test_admits_max_per_minute_without_sleeping(self, clock):
+        limiter = _RateLimiter(3)
+        for _ in range(3):
+            limiter.acquire()
+        assert clock.sleeps == []
+        assert len(limiter._starts) == 3
+
+    def test_blocks_until_oldest_start_leaves_window(self, clock):
+        limiter = _RateLimiter(2)
+        limiter.acquire()
+        clock.now += 10
+        limiter.acquire()
+        limiter.acquire()
+        # the first start (t=1000) leaves the window at t=1060; we were at t=1010
+        assert clock.sleeps == [pytest.approx(50)]
+        assert clock.now == pytest.approx(1060)
+
+    def test_window_slides(self, clock):
+        limiter = _RateLimiter(2)
+        limiter.acquire()
+        limiter.acquire()
+        clock.now += 60
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == []
+        assert list(limiter._starts) == [1060, 1060]
+
+    def test_concurrent_callers_never_exceed_limit(self):
+        limiter = _RateLimiter(5)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=1)
+        assert all(not t.is_alive() for t in threads)
+        assert len(limiter._starts) == 5
+
+        blocked = threading.Thread(target=limiter.acquire, daemon=True)
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+        assert len(limiter._starts) == 5
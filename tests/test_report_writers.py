@@ -0,0 +1,148 @@
+# tests/test_report_writers.py
+import asyncio
+import os
+import queue
+import subprocess
+import sys
+
+import pytest
+
+import roma_agents.sentient_health_agents as agents
+
+
+class FakeHealthDatabase:
+    instances = []
+
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+        FakeHealthDatabase.instances.append(self)
+
+    async def save_reports(self, items):
+        self.batches.append(list(items))
+        return len(items)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestAgentReportWriter:
+    @pytest.fixture(autouse=True)
+    def fake_db(self, monkeypatch):
+        FakeHealthDatabase.instances = []
+        monkeypatch.setattr(agents, "HealthDatabase", FakeHealthDatabase)
+        monkeypatch.setattr(agents, "_REPORT_QUEUE", queue.Queue())
+
+    def test_import_starts_no_writer_thread(self):
+        code = (
+            "import threading, roma_agents.sentient_health_agents as a;"
+            "print(a._REPORT_WRITER is None, any(t.name == 'report-writer' for t in threading.enumerate()))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.split()[-2:] == ["True", "False"]
+
+    def test_backlog_is_written_in_batches_then_closed(self):
+        for i in range(120):
+            agents._REPORT_QUEUE.put({"input": {"steps": i}, "report": {}})
+        agents._REPORT_QUEUE.put(None)
+
+        agents._report_writer()
+
+        (db,) = FakeHealthDatabase.instances
+        assert [len(batch) for batch in db.batches] == [50, 50, 20]
+        assert [item["input"]["steps"] for batch in db.batches for item in batch] == list(range(120))
+        assert db.closed
+
+    def test_failed_batch_is_logged_and_writer_keeps_going(self, monkeypatch):
+        class FlakyDatabase(FakeHealthDatabase):
+            async def save_reports(self, items):
+                if not self.batches:
+                    self.batches.append(None)
+                    raise OSError("disk full")
+                return await super().save_reports(items)
+
+        monkeypatch.setattr(agents, "HealthDatabase", FlakyDatabase)
+        monkeypatch.setattr(agents, "_REPORT_BATCH_SIZE", 1)
+        for i in range(2):
+            agents._REPORT_QUEUE.put({"input": {"steps": i}, "report": {}})
+        agents._REPORT_QUEUE.put(None)
+
+        agents._report_writer()
+
+        (db,) = FakeHealthDatabase.instances
+        assert db.batches == [None, [{"input": {"steps": 1}, "report": {}}]]
+
+    def test_reporting_agent_queues_report_without_null_id(self, monkeypatch):
+        queued = []
+        monkeypatch.setattr(agents, "_ask_llm", lambda *args, **kwargs: "not json")
+        monkeypatch.setattr(agents, "_queue_report", lambda data, report: queued.append((data, report)))
+
+        result = agents.ReportingAgent().run({"data": {"steps": 8000}})
+
+        assert result["report_save"] == "queued"
+        assert "report_id" not in result
+        assert queued == [({"steps": 8000}, result["report_result"])]
+
+
+class TestMainReportWriter:
+    @pytest.fixture
+    def main(self, tmp_path, monkeypatch):
+        os.environ.setdefault("DB_URL", "sqlite:///" + str(tmp_path / "health.db"))
+        import main
+        return main
+
+    @pytest.mark.asyncio
+    async def test_queued_reports_get_distinct_ids_in_order(self, main):
+        report_queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for i in range(5):
+            fut = loop.create_future()
+            report_queue.put_nowait((main.ReportDB(kind="weekly", input_json=str(i)), fut))
+            futures.append(fut)
+
+        writer = asyncio.create_task(main._report_writer(report_queue))
+        try:
+            ids = await asyncio.wait_for(asyncio.gather(*futures), timeout=5)
+        finally:
+            writer.cancel()
+
+        assert len(set(ids)) == 5
+        assert ids == sorted(ids)
+
+    @pytest.mark.asyncio
+    async def test_backlog_larger_than_batch_is_split(self, main, monkeypatch):
+        batches = []
+        monkeypatch.setattr(main, "_write_reports", lambda recs: batches.append(len(recs)) or list(range(len(recs))))
+        report_queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for _ in range(main.REPORT_BATCH_SIZE + 3):
+            fut = loop.create_future()
+            report_queue.put_nowait((object(), fut))
+            futures.append(fut)
+
+        writer = asyncio.create_task(main._report_writer(report_queue))
+        try:
+            await asyncio.wait_for(asyncio.gather(*futures), timeout=5)
+        finally:
+            writer.cancel()
+
+        assert batches == [main.REPORT_BATCH_SIZE, 3]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_fails_every_waiter(self, main, monkeypatch):
+        def boom(recs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(main, "_write_reports", boom)
+        report_queue = asyncio.Queue()
+        fut = asyncio.get_running_loop().create_future()
+        report_queue.put_nowait((object(), fut))
+
+        writer = asyncio.create_task(main._report_writer(report_queue))
+        try:
+            with pytest.raises(OSError):
+                await asyncio.wait_for(fut, timeout=5)
+        finally:
+            writer.cancel()
@@ -0,0 +1,95 @@
+# tests/test_reports_etag.py
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+# HealthDatabase creates its directory at import; keep it out of /app
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(), "db.sqlite"))
+
+import sentient_roma_api as api
+
+
+class FakeReportDB:
+    def __init__(self, reports):
+        self.reports = reports
+        self.payload_reads = 0
+
+    async def report_created_at(self, report_id):
+        report = self.reports.get(report_id)
+        return report["created_at"] if report else None
+
+    async def get_report(self, report_id):
+        self.payload_reads += 1
+        report = self.reports.get(report_id)
+        return dict(report["payload"]) if report else None
+
+
+class TestReportETag:
+    @pytest.fixture
+    def db(self, monkeypatch):
+        db = FakeReportDB({
+            1: {"created_at": "2026-01-01 10:00:00", "payload": {"summary": "week 1"}},
+            2: {"created_at": "2026-01-08 10:00:00", "payload": {"summary": "week 2"}},
+        })
+        monkeypatch.setattr(api, "report_db", db)
+        return db
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(api.app, headers={"X-API-Key": api.API_KEY} if api.API_KEY else {})
+
+    def etag(self, client, report_id):
+        return client.get(f"/reports/{report_id}").headers["ETag"]
+
+    def test_get_returns_report_with_etag(self, client, db):
+        res = client.get("/reports/1")
+        assert res.status_code == 200
+        assert res.json() == {"id": 1, "summary": "week 1"}
+        assert res.headers["ETag"].startswith('"') and res.headers["ETag"].endswith('"')
+
+    def test_etag_depends_on_created_at(self, client, db):
+        first = self.etag(client, 1)
+        assert first == self.etag(client, 1)
+        assert first != self.etag(client, 2)
+        db.reports[1]["created_at"] = "2026-02-01 10:00:00"
+        assert first != self.etag(client, 1)
+
+    def test_matching_etag_is_304_without_payload_read(self, client, db):
+        etag = self.etag(client, 1)
+        reads = db.payload_reads
+        res = client.get("/reports/1", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.headers["ETag"] == etag
+        assert db.payload_reads == reads
+
+    @pytest.mark.parametrize("header", [
+        "W/{etag}",
+        '"other", {etag}',
+        '"other",W/{etag} , "more"',
+        "*",
+    ])
+    def test_if_none_match_forms(self, client, db, header):
+        etag = self.etag(client, 1)
+        res = client.get("/reports/1", headers={"If-None-Match": header.format(etag=etag)})
+        assert res.status_code == 304
+
+    def test_stale_etag_gets_full_body(self, client, db):
+        res = client.get("/reports/1", headers={"If-None-Match": self.etag(client, 2)})
+        assert res.status_code == 200
+        assert res.json()["summary"] == "week 1"
+
+    def test_missing_report_is_404_even_with_wildcard(self, client, db):
+        res = client.get("/reports/999999", headers={"If-None-Match": "*"})
+        assert res.status_code == 404
+
+    def test_storage_down_is_503_not_304(self, client, monkeypatch):
+        monkeypatch.setattr(api, "report_db", None)
+        res = client.get("/reports/1", headers={"If-None-Match": "*"})
+        assert res.status_code == 503
+
+    @pytest.mark.skipif(not api.API_KEY, reason="API key disabled")
+    def test_requires_api_key(self, db):
+        res = TestClient(api.app).get("/reports/1", headers={"If-None-Match": "*"})
+        assert res.status_code == 401
@@ -0,0 +1,110 @@
+# tests/test_roma_cache.py
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+# main.py creates its SQLite tables at import; keep them out of the repo's data/
+os.environ.setdefault("DB_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "health.db"))
+
+import main
+
+
+class TestRomaCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        main._roma_cache.clear()
+        main._roma_inflight.clear()
+        yield
+        main._roma_cache.clear()
+        main._roma_inflight.clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "analysis"
+
+        tasks = [asyncio.create_task(main._cached("/analysis", {"steps": 1}, fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["analysis"] * 5
+        assert calls == 1
+        assert not main._roma_inflight
+
+    @pytest.mark.asyncio
+    async def test_arrival_while_waiters_queued_does_not_start_second_call(self):
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "analysis"
+
+        first = [asyncio.create_task(main._cached("/analysis", {"steps": 2}, fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        late = asyncio.create_task(main._cached("/analysis", {"steps": 2}, fetch))
+        await asyncio.sleep(0)
+        release.set()
+
+        await asyncio.gather(*first, late)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_reply_skips_fetch(self):
+        async def fetch():
+            return "analysis"
+
+        async def must_not_fetch():
+            raise AssertionError("fetch called on a cache hit")
+
+        assert await main._cached("/execute", {"goal": "g"}, fetch) == "analysis"
+        assert await main._cached("/execute", {"goal": "g"}, must_not_fetch) == "analysis"
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached_and_waiters_get_none(self):
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return None
+
+        tasks = [asyncio.create_task(main._cached("/execute", {"goal": "x"}, fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [None, None, None]
+        assert calls == 1
+        assert await main._cached("/execute", {"goal": "x"}, fetch) is None
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "analysis"
+
+        leader = asyncio.create_task(main._cached("/analysis", {"steps": 3}, fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(main._cached("/analysis", {"steps": 3}, fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+
+        assert await leader == "analysis"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
@@ -0,0 +1,163 @@
+# tests/test_roma_scheduler.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import roma_engine.sentient_roma_runner as runner_module
+from roma_engine.sentient_roma_runner import ROMARunner
+
+
+class TestSubtaskScheduler:
+    @pytest.fixture
+    def runner(self, monkeypatch):
+        runner = ROMARunner()
+        self.fallbacks = []
+
+        def fake_execute(task, depth=0):
+            self.fallbacks.append(task["id"])
+            return {"ok": True, "id": task["id"], "fallback": True}
+
+        monkeypatch.setattr(runner, "_execute", fake_execute)
+        monkeypatch.setattr(runner, "_prepare_subtask_data", lambda subtask, original, completed: dict(subtask))
+        return runner
+
+    def test_dependencies_run_after_their_prerequisites(self, runner, monkeypatch):
+        finished = []
+        lock = threading.Lock()
+
+        def fake_solve(task, depth=0):
+            time.sleep(0.01)
+            with lock:
+                finished.append(task["id"])
+            return {"ok": True, "id": task["id"]}
+
+        monkeypatch.setattr(runner, "_solve", fake_solve)
+        subtasks = [
+            {"id": "report", "depends_on": ["metrics", "coach"]},
+            {"id": "coach", "depends_on": ["metrics"]},
+            {"id": "metrics", "depends_on": ["ingest"]},
+            {"id": "ingest"},
+        ]
+
+        results = runner._execute_subtasks_safely(subtasks, {}, 1)
+
+        assert finished == ["ingest", "metrics", "coach", "report"]
+        # Results come back in planner order, not completion order
+        assert [r["id"] for r in results] == ["report", "coach", "metrics", "ingest"]
+
+    def test_independent_subtasks_overlap(self, runner, monkeypatch):
+        def fake_solve(task, depth=0):
+            time.sleep(0.2)
+            return {"ok": True, "id": task["id"]}
+
+        monkeypatch.setattr(runner, "_solve", fake_solve)
+        start = time.monotonic()
+        runner._execute_subtasks_safely([{"id": f"t{i}"} for i in range(4)], {}, 1)
+        assert time.monotonic() - start < 0.6
+
+    def test_unknown_dependencies_are_ignored(self, runner, monkeypatch):
+        monkeypatch.setattr(runner, "_solve", lambda task, depth=0: {"ok": True, "id": task["id"]})
+        results = runner._execute_subtasks_safely([{"id": "a", "depends_on": ["missing"]}], {}, 1)
+        assert results == [{"ok": True, "id": "a"}]
+
+    def test_cycle_raises(self, runner, monkeypatch):
+        monkeypatch.setattr(runner, "_solve", lambda task, depth=0: {"ok": True, "id": task["id"]})
+        with pytest.raises(ValueError):
+            runner._execute_subtasks_safely(
+                [{"id": "a", "depends_on": ["b"]}, {"id": "b", "depends_on": ["a"]}], {}, 1
+            )
+
+    def test_subtask_past_deadline_times_out_and_its_late_result_is_dropped(self, runner, monkeypatch):
+        monkeypatch.setattr(runner_module, "SUBTASK_TIMEOUT_SECONDS", 0.1)
+        release = threading.Event()
+        solved = []
+        returned = []
+
+        def fake_solve(task, depth=0):
+            solved.append(task["id"])
+            if task["id"] == "slow":
+                release.wait(5)
+            return {"ok": True, "id": task["id"]}
+
+        run_subtask = runner._run_subtask
+
+        def spy_run_subtask(*args):
+            result = run_subtask(*args)
+            returned.append(result)
+            return result
+
+        monkeypatch.setattr(runner, "_solve", fake_solve)
+        monkeypatch.setattr(runner, "_run_subtask", spy_run_subtask)
+        try:
+            results = runner._execute_subtasks_safely([{"id": "fast"}, {"id": "slow"}], {}, 1)
+        finally:
+            release.set()
+
+        assert results[0] == {"ok": True, "id": "fast"}
+        assert results[1]["ok"] is False
+        assert results[1]["status"] == "timeout"
+        assert results[1]["subtask_id"] == "slow"
+
+        # The slow run finishes afterwards, once, and returns nothing
+        deadline = time.monotonic() + 5
+        while len(returned) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sorted(solved) == ["fast", "slow"]
+        assert returned == [{"ok": True, "id": "fast"}, None]
+        assert self.fallbacks == []
+
+    def test_deadline_starts_when_the_worker_picks_the_subtask_up(self, runner, monkeypatch):
+        monkeypatch.setattr(runner_module, "SUBTASK_TIMEOUT_SECONDS", 0.3)
+        # Two workers for four subtasks: the last two queue ~0.2s before they start
+        runner._pools[1] = ThreadPoolExecutor(max_workers=2)
+
+        def fake_solve(task, depth=0):
+            time.sleep(0.2)
+            return {"ok": True, "id": task["id"]}
+
+        monkeypatch.setattr(runner, "_solve", fake_solve)
+        results = runner._execute_subtasks_safely([{"id": f"t{i}"} for i in range(4)], {}, 1)
+        runner._pools[1].shutdown()
+
+        assert [r["id"] for r in results] == ["t0", "t1", "t2", "t3"]
+        assert all(r["ok"] for r in results)
+
+    def test_failed_subtask_is_reported_not_raised(self, runner, monkeypatch):
+        def fake_solve(task, depth=0):
+            raise RuntimeError("agent blew up")
+
+        monkeypatch.setattr(runner, "_solve", fake_solve)
+        results = runner._execute_subtasks_safely([{"id": "a"}], {}, 1)
+        assert results[0]["ok"] is False
+        assert "agent blew up" in results[0]["error"]
+
+    def test_pool_size_comes_from_config(self, runner, monkeypatch):
+        monkeypatch.setattr(runner_module, "SUBTASK_WORKERS", 3)
+        assert runner._pool_for(1)._max_workers == 3
+
+    def test_nested_fan_out_wider_than_pool_does_not_hit_deadline(self, runner, monkeypatch):
+        monkeypatch.setattr(runner_module, "SUBTASK_TIMEOUT_SECONDS", 2.0)
+        monkeypatch.setattr(runner_module, "SUBTASK_WORKERS", 8)
+
+        def fake_solve(task, depth=0):
+            if depth == 1:
+                children = [{"id": f"{task['id']}.{i}"} for i in range(4)]
+                runner._execute_subtasks_safely(children, task, depth + 1)
+            else:
+                time.sleep(0.05)
+            return {"ok": True, "id": task["id"]}
+
+        monkeypatch.setattr(runner, "_solve", fake_solve)
+
+        # 3 concurrent requests x 4 parents = 12 blocked parents, more than a pool's 8 workers
+        def request(n):
+            return runner._execute_subtasks_safely([{"id": f"r{n}.p{i}"} for i in range(4)], {}, 1)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=3) as callers:
+            list(callers.map(request, range(3)))
+
+        assert self.fallbacks == []
+        assert time.monotonic() - start < 2.0
@@ -0,0 +1,63 @@
+# tests/test_task_memo.py
+import pytest
+
+import roma_agents.sentient_health_agents as agents
+from roma_engine.sentient_roma_runner import _TaskMemo
+
+
+class TestTaskMemo:
+    def test_cacheable_values_are_reused(self):
+        memo = _TaskMemo()
+        calls = []
+
+        def compute(task):
+            calls.append(task)
+            return "decision", True
+
+        assert memo.get_or_compute({"a": 1}, compute) == "decision"
+        assert memo.get_or_compute({"a": 1}, compute) == "decision"
+        assert len(calls) == 1
+        assert memo.stats()["hits"] == 1
+
+    def test_fallback_values_are_not_stored(self):
+        memo = _TaskMemo()
+        replies = iter([("fallback", False), ("decision", True)])
+
+        assert memo.get_or_compute({"a": 1}, lambda task: next(replies)) == "fallback"
+        assert memo.get_or_compute({"a": 1}, lambda task: next(replies)) == "decision"
+        assert memo.stats()["size"] == 1
+
+
+class TestAgentDecisions:
+    # Big enough to get past the rule-based atomizer gate and reach the LLM
+    TASK = {"description": "Look into the week", "data": {"steps": 1, "sleep_hours": 2, "workouts": 3, "notes": "x" * 200}}
+
+    @pytest.fixture
+    def llm_down(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("provider outage")
+
+        monkeypatch.setattr(agents, "_ask_llm", fail)
+        monkeypatch.setattr(agents, "_get_plan_template", lambda shape: None)
+
+    def test_atomizer_failure_is_not_cacheable(self, llm_down):
+        assert agents.HealthAtomizer().decide(self.TASK) == (False, False)
+        assert agents.HealthAtomizer().is_atomic(self.TASK) is False
+
+    def test_atomizer_rule_decisions_are_cacheable(self, llm_down):
+        assert agents.HealthAtomizer().decide({"kind": "metrics"}) == (True, True)
+
+    def test_planner_fallback_is_not_cacheable(self, llm_down):
+        subtasks, cacheable = agents.HealthPlanner().decide(self.TASK)
+        assert cacheable is False
+        assert subtasks == agents.standard_plan(self.TASK["data"], fused=False)
+
+    def test_memo_retries_after_an_outage(self, llm_down, monkeypatch):
+        memo = _TaskMemo()
+        atomizer = agents.HealthAtomizer()
+        assert memo.get_or_compute(self.TASK, atomizer.decide) is False
+
+        monkeypatch.setattr(agents, "_ask_llm", lambda *args, **kwargs: '{"is_atomic": true, "reasoning": "ok"}')
+        assert memo.get_or_compute(self.TASK, atomizer.decide) is True
+        assert memo.get_or_compute(self.TASK, atomizer.decide) is True
+        assert memo.stats() == {"hits": 1, "misses": 2, "hit_ratio": 0.333, "size": 1}
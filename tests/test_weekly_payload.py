@@ -0,0 +1,63 @@
+# tests/test_weekly_payload.py
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+# HealthDatabase creates its directory at import; keep it out of /app
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(), "db.sqlite"))
+
+import sentient_roma_api as api
+
+
+class EchoIngest:
+    def run(self, task):
+        return {"normalized_data": task["data"], "ok": True}
+
+
+class EchoRunner:
+    def __init__(self):
+        self.seen = []
+        self.executors = {"ingest": EchoIngest()}
+
+    async def arun_weekly(self, data):
+        self.seen.append(data)
+        return {"data": data}
+
+
+class TestWeeklyPayloadTypes:
+    @pytest.fixture
+    def runner(self, monkeypatch):
+        runner = EchoRunner()
+        monkeypatch.setattr(api, "roma_runner", runner)
+        return runner
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(api.app)
+
+    def test_integer_totals_stay_integers(self, client, runner):
+        res = client.post("/weekly-report", json={"data": {"steps": 72000, "workouts": 4, "sleep_hours": 49}})
+        assert res.status_code == 200
+        echoed = res.json()["report"]["data"]
+        assert echoed == {"steps": 72000, "workouts": 4, "sleep_hours": 49}
+        assert type(echoed["steps"]) is int and type(echoed["workouts"]) is int
+        assert type(runner.seen[0]["steps"]) is int
+        assert type(runner.seen[0]["workouts"]) is int
+
+    def test_fractional_totals_are_accepted(self, client, runner):
+        res = client.post("/weekly-report", json={"data": {"steps": 8500.5, "workouts": 2.5}})
+        assert res.status_code == 200
+        assert runner.seen[0] == {"steps": 8500.5, "workouts": 2.5}
+
+    def test_normalize_echoes_integers(self, client, runner):
+        res = client.post("/normalize", json={"data": {"steps": 72000, "workouts": 4}})
+        assert res.status_code == 200
+        normalized = res.json()["normalized_data"]
+        assert normalized == {"steps": 72000, "workouts": 4}
+        assert all(type(value) is int for value in normalized.values())
+
+    def test_non_numeric_totals_are_rejected(self, client, runner):
+        res = client.post("/weekly-report", json={"data": {"steps": "lots"}})
+        assert res.status_code == 422